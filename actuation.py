@@ -0,0 +1,116 @@
+import collections as Collections
+import json as Json
+import threading as Threading
+import time as Time
+
+
+class Actuator(Threading.Thread):
+    def __init__(self, smartroom, retries=3, backoff=0.5, dead_letters=None):
+        super().__init__(daemon=True)
+        self.smartroom = smartroom
+        self.retries = retries
+        self.backoff = backoff
+        self.dead_letters = dead_letters
+        self.pending = dict()
+
+        self._busy = False
+        self._condition = Threading.Condition()
+        self._stopped = Threading.Event()
+
+    def close(self, timeout=5):
+        with self._condition:
+            self._stopped.set()
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self):
+        while True:
+            with self._condition:
+                writes = self.collect()
+                while not writes:
+                    if self._stopped.is_set() and not self.pending:
+                        return
+                    self._condition.wait(self.measure_delay())
+                    writes = self.collect()
+                self._busy = True
+
+            errors = self.write(writes)
+
+            with self._condition:
+                for datapoint, write in writes.items():
+                    error = errors.get(datapoint)
+                    if error is None or datapoint in self.pending:
+                        continue
+                    if write.attempt >= self.retries or self._stopped.is_set():
+                        self.bury(datapoint, write, error)
+                        continue
+                    self.smartroom.metrics.increment("actuation_retries")
+                    self.pending[datapoint] = write._replace(
+                        attempt=write.attempt + 1,
+                        due=Time.monotonic() + self.backoff * 2 ** write.attempt
+                    )
+                self._busy = False
+                self._condition.notify_all()
+
+    def submit(self, telegrams):
+        now = Time.monotonic()
+        with self._condition:
+            for datapoint, value in dict(telegrams).items():
+                if datapoint in self.pending:
+                    self.smartroom.metrics.increment("actuation_coalesced")
+                self.pending[datapoint] = Actuator.Write(value, 0, now)
+            self._condition.notify_all()
+
+    def wait(self, timeout=None):
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self.pending and not self._busy,
+                timeout
+            )
+
+    def bury(self, datapoint, write, error):
+        print(f"{self.__class__.__name__} failed to actuate datapoint {datapoint}")
+        self.smartroom.metrics.increment("actuation_dead_letters")
+        if not self.dead_letters:
+            return
+
+        try:
+            with open(self.dead_letters, "a") as file:
+                file.write(Json.dumps({
+                    "timestamp": Time.time(),
+                    "datapoint": datapoint,
+                    "value": write.value,
+                    "attempts": write.attempt + 1,
+                    "error": repr(error.__cause__ or error)
+                }) + "\n")
+        except OSError:
+            print(f"{self.__class__.__name__} failed to write {self.dead_letters}")
+
+    def collect(self):
+        now = Time.monotonic()
+        writes = {
+            datapoint: write
+            for datapoint, write in self.pending.items()
+            if self._stopped.is_set() or write.due <= now
+        }
+        for datapoint in writes:
+            del self.pending[datapoint]
+        return writes
+
+    def measure_delay(self):
+        if not self.pending:
+            return None
+        return max(0, min(write.due for write in self.pending.values()) - Time.monotonic())
+
+    def write(self, writes):
+        try:
+            return self.smartroom.perform_requests({
+                datapoint: write.value
+                for datapoint, write in writes.items()
+            })
+        except Exception as error:
+            return dict.fromkeys(writes, error)
+
+    class Write(Collections.namedtuple("Write", ("value", "attempt", "due"))):
+        __slots__ = ()
@@ -0,0 +1,296 @@
+import collections as Collections
+import functools as Functools
+import threading as Threading
+import time as Time
+
+import numpy as Numpy
+import speech_recognition as Speech
+
+
+class AudioStream(object):
+    def __init__(self, microphone):
+        self.microphone = microphone
+        self.lock = Threading.RLock()
+        self.source = None
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            if self.source is None:
+                self.source = self.microphone.__enter__()
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.source
+
+    def __exit__(self, *exception):
+        self.lock.release()
+
+    def close(self, timeout=1):
+        if not self.lock.acquire(timeout=timeout):
+            print(f"{self.__class__.__name__} is still being read and was left open")
+            return
+        try:
+            if self.source is not None:
+                self.microphone.__exit__(None, None, None)
+                self.source = None
+        finally:
+            self.lock.release()
+
+    @classmethod
+    def convert(cls, buffer, source, sample_rate=None):
+        return Numpy.frombuffer(
+            Speech.AudioData(buffer, source.SAMPLE_RATE, source.SAMPLE_WIDTH).get_raw_data(
+                convert_rate=sample_rate,
+                convert_width=2
+            ),
+            dtype=Numpy.int16
+        )
+
+    @classmethod
+    def measure_energy(cls, samples):
+        return Numpy.sqrt(Numpy.mean(samples.astype(float) ** 2)) if len(samples) else 0
+
+
+class Calibrator(object):
+    def __init__(self, recognizer, interval=30, duration=0.25):
+        self.recognizer = recognizer
+        self.interval = interval
+        self.duration = duration
+
+        self._energies = Collections.deque()
+        self._seconds = 0.0
+        self._updated = Time.monotonic()
+        self._lock = Threading.Lock()
+
+    def observe(self, energy, seconds):
+        if energy > self.recognizer.energy_threshold:
+            return self.recognizer.energy_threshold
+
+        with self._lock:
+            self._energies.append((energy, seconds))
+            self._seconds += seconds
+            while len(self._energies) > 1 and self._seconds - self._energies[0][1] >= self.duration:
+                self._seconds -= self._energies.popleft()[1]
+            if self._seconds < self.duration or Time.monotonic() - self._updated < self.interval:
+                return self.recognizer.energy_threshold
+
+            energy = sum(energy * seconds for energy, seconds in self._energies) / self._seconds
+            seconds = self._seconds
+            self._energies.clear()
+            self._seconds = 0.0
+            self._updated = Time.monotonic()
+        return self.calibrate(energy, seconds)
+
+    def calibrate(self, energy, seconds):
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** seconds
+        target = energy * self.recognizer.dynamic_energy_ratio
+        self.recognizer.energy_threshold = self.recognizer.energy_threshold * damping + target * (1 - damping)
+        return self.recognizer.energy_threshold
+
+
+class WakeWordDetector(object):
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+
+    def detect(self, source):
+        raise NotImplementedError
+
+
+class TemplateWakeWordDetector(WakeWordDetector):
+    FRAME_LENGTH = 0.025
+    FRAME_STEP = 0.010
+    FILTERS = 26
+    PRE_ROLL = 0.2
+    SILENCE = 0.3
+    THRESHOLD = 8.0
+
+    def __init__(self, recognizer, templates, threshold=THRESHOLD, sample_rate=16000, calibrator=None):
+        super().__init__(recognizer)
+        self.threshold = threshold
+        self.calibrator = calibrator
+        self.sample_rate = sample_rate
+        self.templates = [
+            self.extract_features(self.read_samples(template, sample_rate), sample_rate)
+            for template in templates
+        ]
+        self.maximum_duration = 2 * max(
+            (len(template) * self.FRAME_STEP for template in self.templates),
+            default=1.0
+        )
+
+    def detect(self, source):
+        while True:
+            samples = self.capture_segment(source)
+            if len(samples) and self.measure(samples) < self.threshold:
+                return True
+
+    def capture_segment(self, source):
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        pre_roll = Collections.deque(maxlen=max(1, int(self.PRE_ROLL / seconds_per_buffer)))
+        segment = list()
+        silence = 0
+
+        while True:
+            samples = AudioStream.convert(source.stream.read(source.CHUNK), source, self.sample_rate)
+            energy = AudioStream.measure_energy(samples)
+            if not segment:
+                if self.calibrator is not None:
+                    self.calibrator.observe(energy, seconds_per_buffer)
+                pre_roll.append(samples)
+                if energy > self.recognizer.energy_threshold:
+                    segment = list(pre_roll)
+                continue
+
+            segment += [samples]
+            silence = silence + 1 if energy <= self.recognizer.energy_threshold else 0
+            if silence * seconds_per_buffer >= self.SILENCE:
+                break
+            if len(segment) * seconds_per_buffer >= self.maximum_duration:
+                break
+
+        return Numpy.concatenate(segment)
+
+    def enroll(self, source, path):
+        samples = self.capture_segment(source)
+        audio = Speech.AudioData(samples.tobytes(), self.sample_rate, 2)
+        with open(path, "wb") as file:
+            file.write(audio.get_wav_data())
+        self.templates += [self.extract_features(samples, self.sample_rate)]
+
+    def measure(self, samples):
+        features = self.extract_features(samples, self.sample_rate)
+        return min(
+            (self.measure_distance(features, template) for template in self.templates),
+            default=Numpy.inf
+        )
+
+    @classmethod
+    def extract_features(cls, samples, sample_rate):
+        length = int(sample_rate * cls.FRAME_LENGTH)
+        step = int(sample_rate * cls.FRAME_STEP)
+        samples = samples.astype(float)
+        if len(samples) < length:
+            samples = Numpy.pad(samples, (0, length - len(samples)))
+
+        frames = Numpy.lib.stride_tricks.sliding_window_view(samples, length)[::step]
+        spectrum = Numpy.abs(Numpy.fft.rfft(frames * Numpy.hamming(length), n=512)) ** 2
+        features = Numpy.log(spectrum @ cls.get_filterbank(sample_rate).T + 1e-10)
+        return features - features.mean(axis=0)
+
+    @classmethod
+    def measure_distance(cls, features, template):
+        cost = Numpy.sqrt(((features[:, None, :] - template[None, :, :]) ** 2).sum(axis=2))
+        accumulated = Numpy.full(len(template) + 2, Numpy.inf)
+        accumulated[1] = 0
+
+        for row in cost:
+            accumulated[2:] = row + Numpy.minimum(
+                accumulated[2:],
+                Numpy.minimum(accumulated[1:-1], accumulated[:-2])
+            )
+            accumulated[:2] = Numpy.inf
+        return accumulated[-1] / len(features)
+
+    @staticmethod
+    @Functools.lru_cache(maxsize=8)
+    def get_filterbank(sample_rate):
+        def to_mel(hertz):
+            return 2595 * Numpy.log10(1 + hertz / 700)
+
+        def to_hertz(mel):
+            return 700 * (10 ** (mel / 2595) - 1)
+
+        filters = TemplateWakeWordDetector.FILTERS
+        points = to_hertz(Numpy.linspace(0, to_mel(sample_rate / 2), filters + 2))
+        bins = Numpy.floor(513 * points / sample_rate).astype(int)
+        filterbank = Numpy.zeros((filters, 257))
+
+        for i in range(1, filters + 1):
+            left, center, right = bins[i - 1], bins[i], bins[i + 1]
+            for j in range(left, center):
+                filterbank[i - 1, j] = (j - left) / max(center - left, 1)
+            for j in range(center, right):
+                filterbank[i - 1, j] = (right - j) / max(right - center, 1)
+        return filterbank
+
+    @staticmethod
+    def read_samples(path, sample_rate):
+        with Speech.AudioFile(path) as source:
+            audio = Speech.Recognizer().record(source)
+        return Numpy.frombuffer(
+            audio.get_raw_data(convert_rate=sample_rate, convert_width=2),
+            dtype=Numpy.int16
+        )
+
+
+class VoiceActivityDetector(object):
+    def __init__(self, recognizer, frame=0.02, onset=0.06, pre_roll=0.3, silence=0.6, maximum=8.0, padding=0.1, calibrator=None):
+        self.recognizer = recognizer
+        self.calibrator = calibrator
+        self.frame = frame
+        self.onset = onset
+        self.pre_roll = pre_roll
+        self.silence = silence
+        self.maximum = maximum
+        self.padding = padding
+
+    def listen(self, source):
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        count = max(1, round(seconds_per_buffer / self.frame))
+        pre_roll = Collections.deque(maxlen=max(1, int(self.pre_roll / seconds_per_buffer)) + 1)
+        segment = list()
+        voiced = 0
+        silence = 0
+
+        while True:
+            buffer = source.stream.read(source.CHUNK)
+            if not buffer:
+                break
+            samples = AudioStream.convert(buffer, source)
+            frames = self.classify_frames(samples, count, source.SAMPLE_RATE)
+
+            if not segment:
+                pre_roll.append((samples, frames))
+                for length, is_speech in frames:
+                    voiced = voiced + length if is_speech else 0
+                if voiced / source.SAMPLE_RATE >= self.onset:
+                    segment = list(pre_roll)
+                continue
+
+            segment += [(samples, frames)]
+            for length, is_speech in frames:
+                silence = 0 if is_speech else silence + length
+            if silence / source.SAMPLE_RATE >= self.silence:
+                break
+            if len(segment) * seconds_per_buffer >= self.maximum:
+                break
+
+        if not segment:
+            raise Speech.WaitTimeoutError("listening timed out while waiting for phrase to start")
+
+        samples = self.trim(
+            Numpy.concatenate([samples for samples, frames in segment]),
+            [frame for samples, frames in segment for frame in frames],
+            int(self.padding * source.SAMPLE_RATE)
+        )
+        return Speech.AudioData(samples.tobytes(), source.SAMPLE_RATE, 2)
+
+    def classify_frames(self, samples, count, sample_rate=None):
+        frames = list()
+        for frame in Numpy.array_split(samples, count):
+            energy = AudioStream.measure_energy(frame)
+            if self.calibrator is not None and sample_rate:
+                self.calibrator.observe(energy, len(frame) / sample_rate)
+            frames += [(len(frame), energy > self.recognizer.energy_threshold)]
+        return frames
+
+    @classmethod
+    def trim(cls, samples, frames, padding=0):
+        offsets = Numpy.cumsum([0] + [length for length, is_speech in frames])
+        voiced = [i for i, (length, is_speech) in enumerate(frames) if is_speech]
+        if not voiced:
+            return samples
+        start = max(0, offsets[voiced[0]] - padding)
+        end = min(len(samples), offsets[voiced[-1] + 1] + padding)
+        return samples[start:end]
@@ -0,0 +1,74 @@
+import json as Json
+import threading as Threading
+import time as Time
+
+import requests as Requests
+
+from requests.adapters import HTTPAdapter
+
+
+class Baos(object):
+    AUTHENTICATION_CODES = (Requests.codes.unauthorized, Requests.codes.forbidden)
+
+    def __init__(self, url, credentials, timeout=(3.05, 5), expiry=600, pool_size=8, session=None):
+        self.url = url
+        self.credentials = credentials
+        self.timeout = tuple(timeout) if isinstance(timeout, list) else timeout
+        self.expiry = expiry
+        self.session = session if session is not None else self.build_session(pool_size)
+
+        self._key = None
+        self._expiration = 0
+        self._lock = Threading.Lock()
+
+    @property
+    def key(self):
+        return self._key if Time.monotonic() < self._expiration else None
+
+    def close(self):
+        self.session.close()
+
+    def login(self, force=False):
+        with self._lock:
+            if force or self.key is None:
+                response = self.session.post(
+                    f"{self.url}login",
+                    data=Json.dumps(self.credentials),
+                    timeout=self.timeout
+                )
+                if response.status_code not in (Requests.codes.ok, Requests.codes.no_content):
+                    response.raise_for_status()
+                self._key = dict(user=response.text)
+                self._expiration = Time.monotonic() + self.expiry
+            return self._key
+
+    def logout(self):
+        with self._lock:
+            self._key = None
+            self._expiration = 0
+
+    def request(self, method, link, payload=None, key=None):
+        authenticate = key is None and link != "login"
+        response = method(
+            f"{self.url}{link}",
+            cookies=self.login() if authenticate else key,
+            data=Json.dumps(payload),
+            timeout=self.timeout
+        )
+
+        if authenticate and response.status_code in self.AUTHENTICATION_CODES:
+            response = method(
+                f"{self.url}{link}",
+                cookies=self.login(force=True),
+                data=Json.dumps(payload),
+                timeout=self.timeout
+            )
+        return response
+
+    @classmethod
+    def build_session(cls, pool_size):
+        session = Requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
@@ -0,0 +1,185 @@
+import argparse as Argparse
+import contextlib as Contextlib
+import json as Json
+import sys as Sys
+import time as Time
+import types as Types
+import unittest.mock as Mock
+
+import numpy as Numpy
+
+from baos import Baos
+from devices import Indicator, NullSource
+from smartroom import Smartroom
+
+
+class Benchmark(object):
+    def __init__(self, iterations=10):
+        self.iterations = iterations
+        self.samples = dict()
+        self.smartroom = None
+
+    def measure(self, stage, function, *args, **kwargs):
+        start = Time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.samples.setdefault(stage, list()).append(Time.perf_counter() - start)
+
+    def run(self):
+        with self.stub():
+            for _ in range(self.iterations):
+                self.measure("configuration", Smartroom.get_configuration_file)
+
+            self.smartroom = Smartroom(indicator=Indicator(), source=NullSource())
+            test_data = self.smartroom.build_test_data()
+
+            for _ in range(self.iterations):
+                Smartroom.get_analysis.cache_clear()
+                self.measure("training", self.smartroom.train_classifier)
+
+            accuracy = {"classification": 0, "naive_bayes_classification": 0}
+            for _ in range(self.iterations):
+                for text, label in test_data:
+                    Smartroom.get_analysis.cache_clear()
+                    self.measure("text_uncached", setattr, self.smartroom, "text", text)
+                    self.measure("text", setattr, self.smartroom, "text", text)
+
+                    for method in accuracy:
+                        try:
+                            response = self.measure(
+                                method,
+                                getattr(self.smartroom, f"perform_{method}")
+                            )
+                        except Exception:
+                            continue
+                        accuracy[method] += self.verify(response, label)
+
+                    try:
+                        self.measure("dispatch", self.smartroom.perform_dispatch)
+                    except Exception:
+                        pass
+
+                    try:
+                        self.measure("planning", self.smartroom.perform_planning, text)
+                    except Exception:
+                        pass
+
+                texts = [text for text, label in test_data]
+                self.measure("batch_classification", self.smartroom.classify_many, texts)
+
+            self.smartroom.close()
+
+        return {
+            "timestamp": Time.time(),
+            "iterations": self.iterations,
+            "stages": {
+                stage: self.summarize(samples)
+                for stage, samples in self.samples.items()
+            },
+            "plans": self.smartroom.plans.stats(),
+            "accuracy": {
+                method: correct / (len(test_data) * self.iterations)
+                for method, correct in accuracy.items()
+            }
+        }
+
+    @Contextlib.contextmanager
+    def stub(self):
+        with Contextlib.ExitStack() as stack:
+            stack.enter_context(Mock.patch.object(
+                Baos,
+                "build_session",
+                classmethod(lambda cls, pool_size: StubSession())
+            ))
+            stack.enter_context(Mock.patch.object(
+                Smartroom,
+                "save_classifier",
+                lambda self, classifier: None
+            ))
+            stack.enter_context(Mock.patch.object(
+                Smartroom,
+                "build_mirror",
+                lambda self: None
+            ))
+            yield
+
+    @classmethod
+    def compare(cls, results, baseline, tolerance):
+        regressions = list()
+        for stage, summary in results["stages"].items():
+            if stage not in baseline["stages"]:
+                continue
+            previous = baseline["stages"][stage]["p50"]
+            change = (summary["p50"] - previous) / previous if previous else 0
+            print(f"{stage:>28}: p50 {summary['p50'] * 1e3:9.3f} ms ({change:+.1%})")
+            if change > tolerance:
+                regressions += [stage]
+
+        for method, accuracy in results["accuracy"].items():
+            previous = baseline["accuracy"].get(method, accuracy)
+            print(f"{method:>28}: accuracy {accuracy:.3f} ({accuracy - previous:+.3f})")
+            if accuracy < previous:
+                regressions += [method]
+        return regressions
+
+    @classmethod
+    def verify(cls, response, label):
+        return bool(response) and all(
+            polarity == label
+            for verb, polarity in response.values()
+        )
+
+    @classmethod
+    def summarize(cls, samples):
+        samples = Numpy.array(samples)
+        return {
+            "count": len(samples),
+            "mean": float(samples.mean()),
+            "p50": float(Numpy.percentile(samples, 50)),
+            "p99": float(Numpy.percentile(samples, 99)),
+            "throughput": float(len(samples) / samples.sum()) if samples.sum() else None
+        }
+
+
+class StubSession(object):
+    def close(self):
+        pass
+
+    def get(self, url, **kwargs):
+        return Types.SimpleNamespace(status_code=200, text="[]")
+
+    def post(self, url, **kwargs):
+        return Types.SimpleNamespace(status_code=200, text="benchmark")
+
+    def put(self, url, **kwargs):
+        return Types.SimpleNamespace(status_code=204, text="")
+
+
+if __name__ == "__main__":
+    parser = Argparse.ArgumentParser(description="Benchmark the Smartroom stages without hardware")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    arguments = parser.parse_args()
+
+    results = Benchmark(arguments.iterations).run()
+    with open(arguments.output, "w") as file:
+        Json.dump(results, file, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            regressions = Benchmark.compare(results, Json.load(file), arguments.tolerance)
+        if regressions:
+            print(f"Benchmark found regressions in {', '.join(regressions)}")
+            Sys.exit(1)
+    else:
+        for stage, summary in results["stages"].items():
+            print(
+                f"{stage:>28}: p50 {summary['p50'] * 1e3:9.3f} ms"
+                f"  p99 {summary['p99'] * 1e3:9.3f} ms"
+                f"  {summary['throughput']:10.1f}/s"
+            )
+        for method, accuracy in results["accuracy"].items():
+            print(f"{method:>28}: accuracy {accuracy:.3f}")
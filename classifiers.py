@@ -0,0 +1,195 @@
+import threading as Threading
+
+import numpy as Numpy
+
+from nltk.classify import NaiveBayesClassifier as Model
+from nltk.probability import ELEProbDist, FreqDist
+from textblob.tokenizers import word_tokenize
+
+
+class Classifier(object):
+    def __init__(self, classifier):
+        self.classifier = classifier
+        self.learning = Threading.RLock()
+        self.revision = 0
+        self.updates = 0
+
+        self._lock = Threading.Lock()
+
+    def classify(self, text):
+        raise NotImplementedError
+
+    def classify_many(self, texts):
+        return [self.classify(text) for text in texts]
+
+    def export(self):
+        return self.classifier.classifier
+
+    def labels(self):
+        return self.classifier.labels()
+
+    def update(self, text, label):
+        raise NotImplementedError
+
+
+class NaiveBayesClassifier(Classifier):
+    def classify(self, text):
+        return self.classifier.classify(text)
+
+
+class VectorizedClassifier(Classifier):
+    def __init__(self, classifier):
+        super().__init__(classifier)
+        model = classifier.classifier
+        self._labels = sorted(model.labels())
+        self.features = {
+            fname: index
+            for index, fname in enumerate(sorted({
+                fname for _, fname in model._feature_probdist
+            }))
+        }
+
+        self.label_counts = Numpy.array([
+            model._label_probdist.freqdist()[label] for label in self._labels
+        ], dtype=float)
+        self.counts = Numpy.zeros((len(self._labels), len(self.features), 2))
+        for (label, fname), probdist in model._feature_probdist.items():
+            freqdist = probdist.freqdist()
+            self.counts[self._labels.index(label), self.features[fname]] = freqdist[False], freqdist[True]
+
+        self.compile()
+
+    def classify(self, text):
+        columns, values = self.vectorize(text)
+        scores = self.priors + self.likelihoods[:, columns, values].sum(axis=1)
+        return self.select(scores)
+
+    def classify_many(self, texts):
+        rows, columns, values = list(), list(), list()
+        for row, text in enumerate(texts):
+            row_columns, row_values = self.vectorize(text)
+            rows += [row] * len(row_columns)
+            columns += row_columns
+            values += row_values
+
+        scores = Numpy.tile(self.priors, (len(texts), 1))
+        Numpy.add.at(scores, rows, self.likelihoods[:, columns, values].T)
+        return [self.select(row) for row in scores]
+
+    def compile(self):
+        observed = self.counts.sum(axis=2)
+        self.missing = (observed < self.label_counts[:, None]).any(axis=0)
+        self.bins = (self.counts.sum(axis=0) > 0).sum(axis=1) + self.missing
+
+        self.priors = self.estimate_priors()
+        self.likelihoods = (
+            Numpy.log(self.counts + 0.5)
+            - Numpy.log(self.label_counts[:, None, None] + 0.5 * self.bins[None, :, None])
+        )
+        return self.bins
+
+    def estimate_priors(self):
+        return (
+            Numpy.log(self.label_counts + 0.5)
+            - Numpy.log(self.label_counts.sum() + 0.5 * len(self._labels))
+        )
+
+    def export(self):
+        with self._lock:
+            bins = self.bins
+            feature_probdist = dict()
+            for fname, j in self.features.items():
+                for i, label in enumerate(self._labels):
+                    freqdist = FreqDist()
+                    for value, count in (
+                        (False, self.counts[i, j, 0]),
+                        (True, self.counts[i, j, 1]),
+                        (None, self.label_counts[i] - self.counts[i, j].sum())
+                    ):
+                        if count > 0:
+                            freqdist[value] = int(count)
+                    feature_probdist[label, fname] = ELEProbDist(freqdist, bins=int(bins[j]))
+
+            return Model(
+                ELEProbDist(FreqDist({
+                    label: int(count)
+                    for label, count in zip(self._labels, self.label_counts)
+                    if count > 0
+                })),
+                feature_probdist
+            )
+
+    def grow(self, width):
+        width = max(width, 2 * self.counts.shape[1])
+        self.counts = Numpy.concatenate([
+            self.counts,
+            Numpy.zeros((len(self._labels), width - self.counts.shape[1], 2))
+        ], axis=1)
+        self.compile()
+
+    def labels(self):
+        return list(self._labels)
+
+    def refresh(self, row, columns):
+        columns = Numpy.array(columns, dtype=int)
+        flipped = ~self.missing
+        flipped[columns] = False
+        self.missing[flipped] = True
+        self.bins[flipped] += 1
+
+        counts = self.counts[:, columns]
+        self.missing[columns] = (counts.sum(axis=2) < self.label_counts[:, None]).any(axis=0)
+        self.bins[columns] = (counts.sum(axis=0) > 0).sum(axis=1) + self.missing[columns]
+
+        changed = Numpy.union1d(columns, Numpy.flatnonzero(flipped))
+        self.likelihoods[:, changed] = (
+            Numpy.log(self.counts[:, changed] + 0.5)
+            - Numpy.log(self.label_counts[:, None, None] + 0.5 * self.bins[None, changed, None])
+        )
+        self.likelihoods[row] = (
+            Numpy.log(self.counts[row] + 0.5)
+            - Numpy.log(self.label_counts[row] + 0.5 * self.bins)[:, None]
+        )
+        self.priors = self.estimate_priors()
+
+    def select(self, scores):
+        best = scores.max()
+        return max(
+            label
+            for label, score in zip(self._labels, scores)
+            if score == best
+        )
+
+    def update(self, text, label):
+        if label not in self._labels:
+            raise ValueError(f"{self.__class__.__name__} received an unknown label")
+
+        with self._lock:
+            self.classifier._word_set.update(word_tokenize(text, include_punc=False))
+            features = self.classifier.extract_features(text)
+            new = [fname for fname in features if fname not in self.features]
+            if len(self.features) + len(new) > self.counts.shape[1]:
+                self.grow(len(self.features) + len(new))
+            for fname in new:
+                self.features[fname] = len(self.features)
+
+            i = self._labels.index(label)
+            self.label_counts[i] += 1
+            for fname, fval in features.items():
+                self.counts[i, self.features[fname], int(bool(fval))] += 1
+            self.refresh(i, [self.features[fname] for fname in features])
+            self.revision += 1
+
+    def vectorize(self, text):
+        columns, values = list(), list()
+        for fname, fval in self.classifier.extract_features(text).items():
+            if fname in self.features:
+                columns += [self.features[fname]]
+                values += [int(bool(fval))]
+        return columns, values
+
+
+ENGINES = {
+    "naive_bayes": NaiveBayesClassifier,
+    "vectorized": VectorizedClassifier
+}
@@ -0,0 +1,151 @@
+import collections.abc as Abc
+import os as Os
+import threading as Threading
+
+import yaml as Yaml
+
+LOADER = getattr(Yaml, "CSafeLoader", Yaml.SafeLoader)
+
+
+class Configuration(Abc.Mapping):
+    SCHEMA = {
+        "CLASSIFIER": Abc.Mapping,
+        "COMMANDS": Abc.Mapping,
+        "DEFAULT_SLEEP_WORDS": tuple,
+        "DEFAULT_WAKE_WORD": str,
+        "KNX_BAOS_SERVER": Abc.Mapping,
+        "MICROPHONE_MODEL_NAME": str,
+        "NOUN_TAGS": tuple,
+        "PARAMETERS": tuple,
+        "VERB_TAGS": tuple
+    }
+    SECTIONS = {
+        "CLASSIFIER": ("SNAPSHOT",),
+        "COMMANDS": ("BAOS", "PHRASES", "WORDS"),
+        "KNX_BAOS_SERVER": ("PASSWORD", "URL", "USERNAME")
+    }
+
+    def __init__(self, data=None):
+        self._data = {
+            key: self.freeze(value)
+            for key, value in dict(data or dict()).items()
+        }
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def merge(self, overlay):
+        merged = dict(self._data)
+        for key, value in overlay.items():
+            if isinstance(value, Abc.Mapping) and isinstance(merged.get(key), Configuration):
+                merged[key] = merged[key].merge(value)
+            else:
+                merged[key] = value
+        return Configuration(merged)
+
+    def thaw(self):
+        return self.thaw_value(self)
+
+    def validate(self):
+        for key, kind in self.SCHEMA.items():
+            if key not in self:
+                raise Configuration.ValidationError(f"{self.__class__.__name__} is missing {key}")
+            if not isinstance(self[key], kind):
+                raise Configuration.ValidationError(
+                    f"{self.__class__.__name__} expected {key} to be a {kind.__name__}"
+                )
+
+        for section, keys in self.SECTIONS.items():
+            for key in keys:
+                if key not in self[section]:
+                    raise Configuration.ValidationError(
+                        f"{self.__class__.__name__} is missing {section}.{key}"
+                    )
+
+        for parameters in self["PARAMETERS"]:
+            if not isinstance(parameters, tuple):
+                raise Configuration.ValidationError(
+                    f"{self.__class__.__name__} expected PARAMETERS to hold groups of words"
+                )
+
+        for key, datapoints in self.get("ROUTING", dict()).items():
+            if not isinstance(datapoints, tuple) or not all(isinstance(datapoint, int) for datapoint in datapoints):
+                raise Configuration.ValidationError(
+                    f"{self.__class__.__name__} expected ROUTING.{key} to list datapoint numbers"
+                )
+        return self
+
+    @classmethod
+    def freeze(cls, value):
+        if isinstance(value, Configuration):
+            return value
+        if isinstance(value, Abc.Mapping):
+            return cls(value)
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.freeze(item) for item in value)
+        return value
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path) as file:
+                data = Yaml.load(file, Loader=LOADER)
+        except OSError:
+            raise Configuration.ValidationError(f"{cls.__name__} failed to locate {path}")
+        except Yaml.YAMLError:
+            raise Configuration.ValidationError(f"{cls.__name__} failed to parse {path}")
+
+        if not isinstance(data, Abc.Mapping):
+            raise Configuration.ValidationError(f"{cls.__name__} found no settings in {path}")
+        return cls(data).validate()
+
+    @classmethod
+    def thaw_value(cls, value):
+        if isinstance(value, Abc.Mapping):
+            return {key: cls.thaw_value(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [cls.thaw_value(item) for item in value]
+        return value
+
+    class ValidationError(Exception):
+        pass
+
+
+class Watcher(Threading.Thread):
+    def __init__(self, path, callback, interval=2):
+        super().__init__(daemon=True)
+        self.path = path
+        self.callback = callback
+        self.interval = interval
+        self._signature = self.measure()
+        self._stopped = Threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            signature = self.measure()
+            if signature is None or signature == self._signature:
+                continue
+            self._signature = signature
+            try:
+                self.callback()
+            except Exception as e:
+                print(f"{self.__class__.__name__} failed to reload {self.path}: {e}")
+
+    def measure(self):
+        try:
+            status = Os.stat(self.path)
+        except OSError:
+            return None
+        return status.st_mtime_ns, status.st_size
+
+    def stop(self):
+        self._stopped.set()
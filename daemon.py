@@ -0,0 +1,207 @@
+import argparse as Argparse
+import asyncio as Asyncio
+import functools as Functools
+import glob as Glob
+import os as Os
+import threading as Threading
+
+import yaml as Yaml
+
+from baos import Baos
+from config import LOADER, Watcher
+from metrics import Metrics
+from smartroom import Smartroom
+
+
+class Daemon(object):
+    BACKOFF = 0.5
+    BACKOFF_LIMIT = 8.0
+
+    def __init__(self, directory, configurations=None):
+        self.directory = directory
+        self.configurations = configurations or Smartroom.get_configuration_file()
+        self.classifiers = dict()
+        self.paths = dict()
+        self.rooms = dict()
+        self.watchers = list()
+        self.metrics = None
+        self.session = None
+
+    def build_rooms(self):
+        paths = sorted(Glob.glob(Os.path.join(self.directory, "*.yaml")))
+        if not paths:
+            raise Smartroom.ParameterError(
+                f"{self.__class__.__name__} found no room configurations in {self.directory}"
+            )
+
+        server = self.configurations["KNX_BAOS_SERVER"]
+        self.session = Baos.build_session(server.get("POOL_SIZE", 8) * len(paths))
+        self.metrics = Metrics.from_configurations(self.configurations.get("METRICS", dict()))
+
+        for path in paths:
+            name, _ = Os.path.splitext(Os.path.basename(path))
+            configurations = self.build_configurations(name, path)
+            fingerprint = Smartroom.get_fingerprint(configurations)
+
+            room = Smartroom(
+                configurations=configurations,
+                classifier=self.classifiers.get(fingerprint),
+                session=self.session,
+                metrics=self.metrics.bind(room=configurations["METRICS"]["ROOM"])
+            )
+            self.classifiers.setdefault(fingerprint, room.classifier)
+            self.paths[name] = path
+            self.rooms[name] = room
+        return self.rooms
+
+    def build_watchers(self):
+        reload = self.configurations.get("RELOAD", dict())
+        if not reload.get("ENABLED", False):
+            return self.watchers
+
+        self.watchers = [
+            Watcher(Smartroom.get_configuration_path(), self.reload, interval=reload.get("INTERVAL", 2))
+        ] + [
+            Watcher(path, Functools.partial(self.reload_room, name), interval=reload.get("INTERVAL", 2))
+            for name, path in self.paths.items()
+        ]
+        for watcher in self.watchers:
+            watcher.start()
+        return self.watchers
+
+    def build_configurations(self, name, path):
+        with open(path) as file:
+            overlay = Yaml.load(file, Loader=LOADER) or dict()
+        overlay.setdefault("METRICS", dict()).setdefault("ROOM", name)
+        return self.configurations.merge(overlay).validate()
+
+    def close(self):
+        for watcher in self.watchers:
+            watcher.stop()
+        for room in self.rooms.values():
+            room.state = room.BACK
+            room.close()
+        self.rooms.clear()
+        self.classifiers.clear()
+        if self.metrics is not None:
+            self.metrics.close()
+
+    def reload(self):
+        self.configurations = Smartroom.get_configuration_file()
+        for name in self.rooms:
+            self.reload_room(name)
+
+    def reload_room(self, name):
+        return self.rooms[name].reload(self.build_configurations(name, self.paths[name]))
+
+    def run(self):
+        self.build_rooms()
+        self.build_watchers()
+        try:
+            Asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print(f"{self.__class__.__name__} was interrupted")
+        finally:
+            self.close()
+
+    async def serve(self):
+        await Asyncio.gather(*(
+            self.serve_room(name, room)
+            for name, room in self.rooms.items()
+        ))
+
+    async def serve_room(self, name, room):
+        wake_word = room.configurations["DEFAULT_WAKE_WORD"].lower()
+        sleep_words = room.configurations["DEFAULT_SLEEP_WORDS"]
+        awake = False
+        failures = 0
+
+        while True:
+            try:
+                speech = await self.run_in_daemon_thread(room.capture_speech)
+            except EOFError:
+                print(f"{self.__class__.__name__} reached the end of the audio source in {name}")
+                room.state = room.BACK
+                return
+            except Exception:
+                print(f"{self.__class__.__name__} failed to capture the spoken words in {name}")
+                failures += 1
+                await Asyncio.sleep(self.measure_backoff(failures))
+                continue
+            failures = 0
+
+            room.state = room.ASRM
+            text = await Asyncio.to_thread(room.recognize_speech, speech)
+            if text is None:
+                room.state = room.WAKE if awake else room.IDLE
+                continue
+
+            if room.detector is None and not awake:
+                awake = text.lower() == wake_word
+                room.state = room.WAKE if awake else room.IDLE
+                continue
+            awake = False
+
+            print(f"{name}: {text}")
+            if text in sleep_words:
+                room.state = room.BACK
+                return
+
+            try:
+                plan = await Asyncio.to_thread(room.perform_planning, text)
+            except room.ParameterError as e:
+                print(e)
+                room.state = room.IDLE
+                continue
+            except Exception:
+                print(f"{self.__class__.__name__} failed to understand the words in {name}")
+                room.state = room.IDLE
+                continue
+            print(f"{name}: {dict(plan.response)}")
+            if plan.telegrams is None:
+                room.state = room.IDLE
+                continue
+
+            room.state = room.KNXM
+            room.actuator.submit(plan.telegrams)
+            room.state = room.IDLE
+
+    @classmethod
+    def measure_backoff(cls, failures):
+        return min(cls.BACKOFF * 2 ** (failures - 1), cls.BACKOFF_LIMIT)
+
+    @classmethod
+    def run_in_daemon_thread(cls, function, *args):
+        loop = Asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(result, error):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def run():
+            result, error = None, None
+            try:
+                result = function(*args)
+            except Exception as exception:
+                error = exception
+            try:
+                loop.call_soon_threadsafe(settle, result, error)
+            except RuntimeError:
+                pass
+
+        Threading.Thread(target=run, daemon=True).start()
+        return future
+
+
+if __name__ == "__main__":
+    configurations = Smartroom.get_configuration_file()
+    parser = Argparse.ArgumentParser(description="Serve every room in one process with a shared model")
+    parser.add_argument("--rooms", default=configurations.get("DAEMON", dict()).get("ROOMS", "rooms"))
+    arguments = parser.parse_args()
+
+    Daemon(arguments.rooms, configurations).run()
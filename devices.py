@@ -0,0 +1,124 @@
+import glob as Glob
+import io as Io
+import os as Os
+
+import speech_recognition as Speech
+
+
+class Indicator(object):
+    def listen(self):
+        pass
+
+    def set_color_palette(self, *colors):
+        pass
+
+    def speak(self):
+        pass
+
+    def spin(self):
+        pass
+
+    def think(self):
+        pass
+
+    def trace(self):
+        pass
+
+
+class PixelRingIndicator(Indicator):
+    def __init__(self):
+        from pixel_ring import pixel_ring
+        self.pixel_ring = pixel_ring
+
+    def listen(self):
+        self.pixel_ring.listen()
+
+    def set_color_palette(self, *colors):
+        self.pixel_ring.set_color_palette(*colors)
+
+    def speak(self):
+        self.pixel_ring.speak()
+
+    def spin(self):
+        self.pixel_ring.spin()
+
+    def think(self):
+        self.pixel_ring.think()
+
+    def trace(self):
+        self.pixel_ring.trace()
+
+
+class NullSource(Speech.AudioSource):
+    CHUNK = 1024
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+
+    def __init__(self):
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = NullSource.Stream(self.SAMPLE_WIDTH)
+        return self
+
+    def __exit__(self, *exception):
+        self.stream = None
+
+    class Stream(object):
+        def __init__(self, width):
+            self.width = width
+
+        def close(self):
+            pass
+
+        def read(self, size):
+            return bytes(self.width * size)
+
+
+class ReplaySource(Speech.AudioSource):
+    CHUNK = 1024
+    SAMPLE_WIDTH = 2
+
+    def __init__(self, paths, gap=1.5, sample_rate=16000):
+        self.SAMPLE_RATE = sample_rate
+        self.paths = list(paths)
+        self.gap = gap
+        self.stream = None
+
+    def __enter__(self):
+        silence = bytes(int(self.gap * self.SAMPLE_RATE) * self.SAMPLE_WIDTH)
+        frames = [silence]
+        for path in self.paths:
+            with Speech.AudioFile(path) as source:
+                audio = Speech.Recognizer().record(source)
+            frames += [
+                audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=self.SAMPLE_WIDTH),
+                silence
+            ]
+        self.stream = ReplaySource.Stream(b"".join(frames), self.SAMPLE_WIDTH)
+        return self
+
+    def __exit__(self, *exception):
+        self.stream = None
+
+    @classmethod
+    def from_directory(cls, directory, gap=1.5, sample_rate=16000):
+        return cls(
+            sorted(Glob.glob(Os.path.join(directory, "*.wav"))),
+            gap=gap,
+            sample_rate=sample_rate
+        )
+
+    class Stream(object):
+        def __init__(self, data, width):
+            self.buffer = Io.BytesIO(data)
+            self.width = width
+
+        def close(self):
+            self.buffer.close()
+
+        def read(self, size):
+            data = self.buffer.read(self.width * size)
+            if not data:
+                raise EOFError(f"{ReplaySource.__name__} ran out of recordings")
+            return data
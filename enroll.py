@@ -0,0 +1,44 @@
+import argparse as Argparse
+import os as Os
+
+from audio import TemplateWakeWordDetector
+from smartroom import Smartroom
+
+
+if __name__ == "__main__":
+    configurations = Smartroom.get_configuration_file()
+    wake_word = configurations.get("WAKE_WORD", dict())
+    parser = Argparse.ArgumentParser(description="Record wake word templates for the local detector")
+    parser.add_argument("--count", type=int, default=3)
+    parser.add_argument("--directory", default=wake_word.get("DIRECTORY", "templates"))
+    arguments = parser.parse_args()
+
+    smartroom = Smartroom(configurations=configurations.merge({"WAKE_WORD": {"ENGINE": "google"}}))
+    detector = TemplateWakeWordDetector(
+        smartroom.recognizer,
+        list(),
+        threshold=wake_word.get("THRESHOLD", TemplateWakeWordDetector.THRESHOLD),
+        sample_rate=wake_word.get("SAMPLE_RATE", 16000)
+    )
+    Os.makedirs(arguments.directory, exist_ok=True)
+
+    paths = list()
+    try:
+        for i in range(arguments.count):
+            path = Os.path.join(arguments.directory, f"{configurations['DEFAULT_WAKE_WORD'].lower()}{i}.wav")
+            print(f"Say \"{configurations['DEFAULT_WAKE_WORD']}\" ({i + 1}/{arguments.count})")
+            smartroom.state = smartroom.WAKE
+            with smartroom.stream as source:
+                detector.enroll(source, path)
+            smartroom.state = smartroom.IDLE
+            paths += [path]
+    except KeyboardInterrupt:
+        print(f"{detector.__class__.__name__} was interrupted")
+    finally:
+        smartroom.state = smartroom.BACK
+        smartroom.close()
+
+    if paths:
+        print("Set WAKE_WORD.ENGINE to template and WAKE_WORD.TEMPLATES to:")
+        for path in paths:
+            print(f"  - {path}")
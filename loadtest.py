@@ -0,0 +1,507 @@
+import argparse as Argparse
+import bisect as Bisect
+import collections as Collections
+import concurrent.futures as Futures
+import glob as Glob
+import http.cookies as Cookies
+import http.server as Server
+import json as Json
+import os as Os
+import random as Random
+import re as Re
+import secrets as Secrets
+import threading as Threading
+import time as Time
+
+import speech_recognition as Speech
+
+from benchmark import Benchmark
+from devices import Indicator, NullSource, ReplaySource
+from smartroom import Smartroom
+
+
+class MockBaos(Server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, credentials=None, seed=None):
+        super().__init__((host, port), MockBaos.Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.credentials = credentials
+        self.keys = set()
+        self.states = dict()
+        self.telegrams = list()
+        self.counters = Collections.Counter()
+
+        self._lock = Threading.Lock()
+        self._random = Random.Random(seed)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/rest/"
+
+    def close(self):
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def start(self):
+        self._thread = Threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def delay(self):
+        with self._lock:
+            latency = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            failed = self._random.random() < self.error_rate
+        if latency:
+            Time.sleep(latency)
+        return failed
+
+    def login(self, credentials):
+        if self.credentials is not None and credentials != self.credentials:
+            return None
+        key = Secrets.token_hex(8)
+        with self._lock:
+            self.keys.add(key)
+        return key
+
+    def record(self, datapoint, telegram):
+        if not isinstance(telegram, dict) or "value" not in telegram:
+            raise ValueError
+        value = bool(telegram["value"])
+        with self._lock:
+            self.telegrams += [MockBaos.Telegram(Time.perf_counter(), int(datapoint), telegram.get("command"), value)]
+            self.states[int(datapoint)] = value
+
+    def reset(self):
+        with self._lock:
+            self.states.clear()
+            self.telegrams.clear()
+            self.counters.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, telegrams=len(self.telegrams))
+
+    class Handler(Server.BaseHTTPRequestHandler):
+        PATTERN = Re.compile(r"^/rest/datapoints(?:/(\d+))?/?$")
+
+        def do_GET(self):
+            self.handle_request(self.read_datapoints)
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/rest/login":
+                self.respond(404)
+                return
+            self.handle_request(self.log_in, authenticate=False)
+
+        def do_PUT(self):
+            self.handle_request(self.write_datapoints)
+
+        def handle_request(self, function, authenticate=True):
+            server = self.server
+            payload = self.read_payload()
+            with server._lock:
+                server.counters["requests"] += 1
+
+            if server.delay():
+                with server._lock:
+                    server.counters["injected_errors"] += 1
+                self.respond(503)
+                return
+            if authenticate and not self.is_authenticated():
+                with server._lock:
+                    server.counters["unauthorized"] += 1
+                self.respond(401)
+                return
+            function(payload)
+
+        def is_authenticated(self):
+            cookies = Cookies.SimpleCookie(self.headers.get("Cookie", ""))
+            with self.server._lock:
+                return "user" in cookies and cookies["user"].value in self.server.keys
+
+        def log_in(self, credentials):
+            key = self.server.login(credentials)
+            if key is None:
+                self.respond(401)
+                return
+            self.respond(200, key)
+
+        def read_datapoints(self, payload):
+            match = self.PATTERN.match(self.path)
+            if match is None or match.group(1):
+                self.respond(404)
+                return
+            with self.server._lock:
+                states = [
+                    dict(datapoint=datapoint, value=value)
+                    for datapoint, value in sorted(self.server.states.items())
+                ]
+            self.respond(200, Json.dumps(states), "application/json")
+
+        def write_datapoints(self, payload):
+            match = self.PATTERN.match(self.path)
+            if match is None:
+                self.respond(404)
+                return
+
+            try:
+                if match.group(1):
+                    self.server.record(match.group(1), payload)
+                else:
+                    for telegram in payload:
+                        self.server.record(telegram["datapoint"], telegram)
+            except (KeyError, TypeError, ValueError):
+                with self.server._lock:
+                    self.server.counters["malformed"] += 1
+                self.respond(400)
+                return
+            self.respond(204)
+
+        def read_payload(self):
+            length = int(self.headers.get("Content-Length", 0) or 0)
+            if not length:
+                return None
+            try:
+                return Json.loads(self.rfile.read(length))
+            except ValueError:
+                return None
+
+        def respond(self, status, body="", content_type="text/plain"):
+            body = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *arguments):
+            pass
+
+    class Telegram(Collections.namedtuple("Telegram", ("timestamp", "datapoint", "command", "value"))):
+        __slots__ = ()
+
+
+class LoadTest(object):
+    def __init__(self, smartroom, baos, rate=None, concurrency=4, iterations=1, timeout=30):
+        self.smartroom = smartroom
+        self.baos = baos
+        self.rate = rate
+        self.concurrency = concurrency
+        self.iterations = iterations
+        self.timeout = timeout
+        self.results = list()
+
+        self._lock = Threading.Lock()
+
+    def run(self, commands):
+        commands = list(commands) * self.iterations
+        self.results.clear()
+        self.baos.reset()
+        start = Time.perf_counter()
+
+        with Futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = list()
+            for i, command in enumerate(commands):
+                due = None
+                if self.rate:
+                    due = start + i / self.rate
+                    Time.sleep(max(0, due - Time.perf_counter()))
+                futures += [executor.submit(self.replay, command, due)]
+            Futures.wait(futures)
+
+        if not self.smartroom.actuator.wait(self.timeout):
+            print(f"{self.__class__.__name__} gave up waiting for the actuator to drain")
+        elapsed = Time.perf_counter() - start
+        self.settle()
+        return self.report(elapsed)
+
+    def replay(self, command, due=None):
+        smartroom = self.smartroom
+        result = LoadTest.Result(
+            command,
+            dict(),
+            Time.perf_counter() if due is None else due,
+            None,
+            None,
+            None,
+            None
+        )
+
+        try:
+            text = command.text
+            if command.path is not None:
+                speech = self.measure(result, "capture", self.capture, command.path)
+                text = self.measure(result, "recognition", smartroom.recognize_speech, speech)
+                if text is None:
+                    raise Speech.UnknownValueError
+
+            plan = self.measure(result, "planning", smartroom.perform_planning, text)
+            telegrams = dict(plan.telegrams or dict())
+            submitted = Time.perf_counter()
+            if telegrams:
+                smartroom.actuator.submit(telegrams)
+            result = result._replace(text=text, telegrams=telegrams, submitted=submitted)
+        except Exception as e:
+            result = result._replace(error=e.__class__.__name__)
+            result.stages["end_to_end"] = Time.perf_counter() - result.started
+
+        with self._lock:
+            self.results += [result]
+        return result
+
+    def capture(self, path):
+        with ReplaySource([path], gap=0.5) as source:
+            if self.smartroom.vad is None:
+                return self.smartroom.recognizer.record(source)
+            return self.smartroom.listen(source)
+
+    def measure(self, result, stage, function, *args):
+        start = Time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            result.stages[stage] = Time.perf_counter() - start
+
+    def settle(self):
+        writes = dict()
+        for telegram in sorted(self.baos.telegrams):
+            writes.setdefault(telegram.datapoint, list()).append(telegram.timestamp)
+
+        for result in self.results:
+            if result.submitted is None:
+                continue
+            if not result.telegrams:
+                result.stages["end_to_end"] = result.submitted - result.started
+                continue
+
+            delivered = list()
+            for datapoint in result.telegrams:
+                timestamps = writes.get(datapoint, list())
+                i = Bisect.bisect_left(timestamps, result.submitted)
+                if i == len(timestamps):
+                    break
+                delivered += [timestamps[i]]
+            else:
+                result.stages["actuation"] = max(delivered) - result.submitted
+                result.stages["end_to_end"] = max(delivered) - result.started
+
+    def report(self, elapsed):
+        stages = dict()
+        for result in self.results:
+            for stage, sample in result.stages.items():
+                stages.setdefault(stage, list()).append(sample)
+
+        checked = [
+            result
+            for result in self.results
+            if result.command.telegrams is not None and result.error is None
+        ]
+        correct = sum(result.telegrams == result.command.telegrams for result in checked)
+
+        return {
+            "timestamp": Time.time(),
+            "commands": len(self.results),
+            "concurrency": self.concurrency,
+            "rate": self.rate,
+            "elapsed": elapsed,
+            "throughput": len(self.results) / elapsed if elapsed else None,
+            "failures": Collections.Counter(
+                result.error for result in self.results if result.error is not None
+            ),
+            "stages": {
+                stage: Benchmark.summarize(samples)
+                for stage, samples in stages.items()
+            },
+            "correctness": {
+                "checked": len(checked),
+                "correct": correct,
+                "accuracy": correct / len(checked) if checked else None,
+                "mismatches": [
+                    {
+                        "text": result.command.text,
+                        "heard": result.text,
+                        "expected": result.command.telegrams,
+                        "planned": result.telegrams
+                    }
+                    for result in checked
+                    if result.telegrams != result.command.telegrams
+                ]
+            },
+            "writes": self.check_writes(),
+            "plans": self.smartroom.plans.stats(),
+            "metrics": dict(self.smartroom.metrics.snapshot()["counters"]),
+            "baos": self.baos.stats()
+        }
+
+    def check_writes(self):
+        counters = self.smartroom.metrics.snapshot()["counters"]
+        planned = Collections.Counter()
+        latest = dict()
+        for result in sorted(
+            (result for result in self.results if result.telegrams),
+            key=lambda result: result.submitted
+        ):
+            for datapoint, value in result.telegrams.items():
+                planned[datapoint, value] += 1
+                latest[datapoint] = value
+
+        code = self.smartroom.configurations["COMMANDS"]["BAOS"]
+        unexpected = sum(
+            telegram.command != code or (telegram.datapoint, telegram.value) not in planned
+            for telegram in self.baos.telegrams
+        )
+
+        return {
+            "planned": sum(planned.values()),
+            "delivered": len(self.baos.telegrams),
+            "coalesced": counters.get("actuation_coalesced", 0),
+            "suppressed": counters.get("telegrams_suppressed", 0),
+            "retries": counters.get("actuation_retries", 0),
+            "dead_letters": counters.get("actuation_dead_letters", 0),
+            "unexpected": unexpected,
+            "undelivered_commands": sum(
+                bool(result.telegrams) and "actuation" not in result.stages
+                for result in self.results
+            ),
+            "stale": sorted(
+                datapoint
+                for datapoint, value in latest.items()
+                if self.baos.states.get(datapoint) != value
+            )
+        }
+
+    @classmethod
+    def build_expectation(cls, smartroom, text, label):
+        remainder = f" {smartroom.canonicalize(text)} "
+        response = dict()
+        for parameter in sorted(smartroom.vocabulary.routes, key=len, reverse=True):
+            if f" {parameter} " in remainder:
+                remainder = remainder.replace(f" {parameter} ", " | ")
+                response[parameter] = ("?", label)
+        try:
+            return smartroom.build_telegrams(response)
+        except NotImplementedError:
+            return None
+
+    @classmethod
+    def load_corpus(cls, smartroom, directory):
+        try:
+            with open(Os.path.join(directory, "corpus.jsonl")) as file:
+                entries = [Json.loads(line) for line in file if line.strip()]
+        except OSError:
+            entries = [
+                {"path": Os.path.basename(path)}
+                for path in sorted(Glob.glob(Os.path.join(directory, "*.wav")))
+            ]
+
+        if not entries:
+            raise Smartroom.ParameterError(f"{cls.__name__} found no recordings in {directory}")
+        return [
+            LoadTest.Command(
+                entry.get("text"),
+                Os.path.join(directory, entry["path"]),
+                cls.build_expectation(smartroom, entry["text"], entry["label"])
+                if "text" in entry and "label" in entry
+                else None
+            )
+            for entry in entries
+        ]
+
+    @classmethod
+    def load_texts(cls, smartroom):
+        return [
+            LoadTest.Command(text, None, cls.build_expectation(smartroom, text, label))
+            for text, label in smartroom.build_test_data()
+        ]
+
+    class Command(Collections.namedtuple("Command", ("text", "path", "telegrams"))):
+        __slots__ = ()
+
+    class Result(Collections.namedtuple(
+        "Result",
+        ("command", "stages", "started", "text", "telegrams", "submitted", "error")
+    )):
+        __slots__ = ()
+
+
+if __name__ == "__main__":
+    configurations = Smartroom.get_configuration_file()
+    loadtest = configurations.get("LOADTEST", dict())
+    parser = Argparse.ArgumentParser(description="Replay commands through the Smartroom against a local BAOS stand-in")
+    parser.add_argument("--corpus", default=loadtest.get("CORPUS"))
+    parser.add_argument("--rate", type=float, default=loadtest.get("RATE"))
+    parser.add_argument("--concurrency", type=int, default=loadtest.get("CONCURRENCY", 4))
+    parser.add_argument("--iterations", type=int, default=loadtest.get("ITERATIONS", 1))
+    parser.add_argument("--latency", type=float, default=loadtest.get("LATENCY", 0.0))
+    parser.add_argument("--jitter", type=float, default=loadtest.get("JITTER", 0.0))
+    parser.add_argument("--error-rate", type=float, default=loadtest.get("ERROR_RATE", 0.0))
+    parser.add_argument("--seed", type=int, default=loadtest.get("SEED"))
+    parser.add_argument("--timeout", type=float, default=loadtest.get("TIMEOUT", 30))
+    parser.add_argument("--output", default=loadtest.get("OUTPUT", "loadtest.json"))
+    arguments = parser.parse_args()
+
+    server = configurations["KNX_BAOS_SERVER"]
+    baos = MockBaos(
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        error_rate=arguments.error_rate,
+        credentials={"username": server["USERNAME"], "password": server["PASSWORD"]},
+        seed=arguments.seed
+    ).start()
+    smartroom = Smartroom(
+        indicator=Indicator(),
+        source=NullSource(),
+        configurations=configurations.merge({
+            "ACTUATION": {"DEAD_LETTERS": None},
+            "DEVICES": {"INDICATOR": "none", "SOURCE": "none"},
+            "KNX_BAOS_SERVER": {"URL": baos.url},
+            "METRICS": {"DUMP": None, "ENABLED": True, "PORT": None, "ROOM": "loadtest"},
+            "MIRROR": {"ENABLED": False}
+        })
+    )
+
+    try:
+        commands = (
+            LoadTest.load_corpus(smartroom, arguments.corpus)
+            if arguments.corpus
+            else LoadTest.load_texts(smartroom)
+        )
+        results = LoadTest(
+            smartroom,
+            baos,
+            rate=arguments.rate,
+            concurrency=arguments.concurrency,
+            iterations=arguments.iterations,
+            timeout=arguments.timeout
+        ).run(commands)
+    finally:
+        smartroom.close()
+        baos.close()
+
+    with open(arguments.output, "w") as file:
+        Json.dump(results, file, indent=2, default=str)
+
+    for stage, summary in results["stages"].items():
+        print(
+            f"{stage:>28}: p50 {summary['p50'] * 1e3:9.3f} ms"
+            f"  p99 {summary['p99'] * 1e3:9.3f} ms"
+        )
+    print(f"{'throughput':>28}: {results['throughput']:.1f} commands/s")
+    correctness = results["correctness"]
+    if correctness["checked"]:
+        print(f"{'correctness':>28}: {correctness['correct']}/{correctness['checked']}")
+    writes = results["writes"]
+    print(
+        f"{'writes':>28}: {writes['delivered']}/{writes['planned']} delivered"
+        f"  {writes['coalesced']} coalesced  {writes['dead_letters']} dead letters"
+        f"  {writes['unexpected']} unexpected  {len(writes['stale'])} stale"
+    )
+    print(f"{'undelivered commands':>28}: {writes['undelivered_commands']}")
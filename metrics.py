@@ -0,0 +1,183 @@
+import bisect as Bisect
+import collections as Collections
+import functools as Functools
+import http.server as Server
+import json as Json
+import threading as Threading
+import time as Time
+
+
+class Metrics(object):
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    PREFIX = "smartroom"
+
+    def __init__(self, enabled=False, labels=None):
+        self.enabled = enabled
+        self.labels = dict(labels or dict())
+        self.counters = Collections.Counter()
+        self.histograms = dict()
+        self.children = list()
+
+        self._lock = Threading.Lock()
+        self._server = None
+        self._stopped = Threading.Event()
+
+    def bind(self, **labels):
+        child = Metrics(enabled=self.enabled, labels=dict(self.labels, **labels))
+        with self._lock:
+            self.children += [child]
+        return child
+
+    def close(self):
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def dump(self, path):
+        with open(path, "a") as file:
+            for metrics in [self] + list(self.children):
+                file.write(Json.dumps(metrics.snapshot()) + "\n")
+
+    def export(self):
+        families = dict()
+        for metrics in [self] + list(self.children):
+            labels = ",".join(f'{key}="{value}"' for key, value in sorted(metrics.labels.items()))
+            separator = "," if labels else ""
+
+            with metrics._lock:
+                for name, value in sorted(metrics.counters.items()):
+                    families.setdefault((f"{self.PREFIX}_{name}_total", "counter"), list()).append(
+                        f"{self.PREFIX}_{name}_total{{{labels}}} {value}"
+                    )
+                for name, (buckets, total, count) in sorted(metrics.histograms.items()):
+                    lines = families.setdefault((f"{self.PREFIX}_{name}_seconds", "histogram"), list())
+                    cumulative = 0
+                    for bound, bucket in zip(self.BUCKETS + ("+Inf",), buckets):
+                        cumulative += bucket
+                        lines += [
+                            f'{self.PREFIX}_{name}_seconds_bucket{{{labels}{separator}le="{bound}"}} {cumulative}'
+                        ]
+                    lines += [
+                        f"{self.PREFIX}_{name}_seconds_sum{{{labels}}} {total}",
+                        f"{self.PREFIX}_{name}_seconds_count{{{labels}}} {count}"
+                    ]
+
+        lines = list()
+        for (name, kind), series in sorted(families.items()):
+            lines += [f"# TYPE {name} {kind}"] + series
+        return "\n".join(lines) + "\n"
+
+    def increment(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.setdefault(
+                name,
+                [[0] * (len(self.BUCKETS) + 1), 0.0, 0]
+            )
+            histogram[0][Bisect.bisect_left(self.BUCKETS, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def serve(self, port, host="127.0.0.1"):
+        metrics = self
+
+        class Handler(Server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.export().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *arguments):
+                pass
+
+        self._server = Server.ThreadingHTTPServer((host, port), Handler)
+        Threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "timestamp": Time.time(),
+                "labels": dict(self.labels),
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: {
+                        "buckets": dict(zip(map(str, self.BUCKETS + ("+Inf",)), buckets)),
+                        "sum": total,
+                        "count": count
+                    }
+                    for name, (buckets, total, count) in self.histograms.items()
+                }
+            }
+
+    def span(self, name):
+        return Span(self, name)
+
+    def start_dump(self, path, interval=60):
+        def run():
+            while not self._stopped.wait(interval):
+                try:
+                    self.dump(path)
+                except OSError:
+                    print(f"{self.__class__.__name__} failed to write {path}")
+
+        thread = Threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    @classmethod
+    def from_configurations(cls, configurations, labels=None):
+        metrics = cls(enabled=configurations.get("ENABLED", False), labels=labels)
+        if not metrics.enabled:
+            return metrics
+
+        if configurations.get("PORT"):
+            metrics.serve(configurations["PORT"], host=configurations.get("HOST", "127.0.0.1"))
+        if configurations.get("DUMP"):
+            metrics.start_dump(configurations["DUMP"], interval=configurations.get("INTERVAL", 60))
+        return metrics
+
+    @staticmethod
+    def timed(name):
+        def decorator(function):
+            @Functools.wraps(function)
+            def wrapper(self, *args, **kwargs):
+                metrics = getattr(self, "metrics", None)
+                if metrics is None or not metrics.enabled:
+                    return function(self, *args, **kwargs)
+                with metrics.span(name):
+                    return function(self, *args, **kwargs)
+            return wrapper
+        return decorator
+
+
+class Span(object):
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = Time.perf_counter()
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        self.metrics.observe(self.name, Time.perf_counter() - self.start)
+        if kind is not None:
+            self.metrics.increment(f"{self.name}_errors")
+        return False
@@ -0,0 +1,63 @@
+import json as Json
+import threading as Threading
+import time as Time
+
+
+class Mirror(Threading.Thread):
+    def __init__(self, smartroom, interval=30, max_age=60):
+        super().__init__(daemon=True)
+        self.smartroom = smartroom
+        self.interval = interval
+        self.max_age = max_age
+        self.states = dict()
+
+        self._lock = Threading.Lock()
+        self._stopped = Threading.Event()
+
+    def run(self):
+        self.refresh()
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+    def filter(self, telegrams):
+        now = Time.monotonic()
+        with self._lock:
+            return {
+                datapoint: value
+                for datapoint, value in telegrams.items()
+                if self.get(datapoint, now) != value
+            }
+
+    def get(self, datapoint, now=None):
+        now = Time.monotonic() if now is None else now
+        value, timestamp = self.states.get(datapoint, (None, 0))
+        return value if now - timestamp <= self.max_age else None
+
+    def refresh(self):
+        try:
+            response = self.smartroom.perform_request(self.smartroom.GETS, "datapoints")
+            states = self.parse(response.text)
+        except Exception:
+            print(f"{self.__class__.__name__} failed to read the datapoints")
+            return False
+
+        self.update(states)
+        return True
+
+    def stop(self):
+        self._stopped.set()
+
+    def update(self, states):
+        now = Time.monotonic()
+        with self._lock:
+            for datapoint, value in states.items():
+                self.states[datapoint] = (value, now)
+
+    @classmethod
+    def parse(cls, text):
+        payload = Json.loads(text)
+        if isinstance(payload, dict):
+            items = payload.items()
+        else:
+            items = ((item["datapoint"], item["value"]) for item in payload)
+        return {int(datapoint): bool(value) for datapoint, value in items}
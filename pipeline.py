@@ -0,0 +1,173 @@
+import collections as Collections
+import queue as Queue
+import threading as Threading
+
+
+class Pipeline(object):
+    CAPTURE = "capture"
+    RECOGNITION = "recognition"
+    INTERPRETATION = "interpretation"
+    ACTUATION = "actuation"
+    BACKOFF = 0.5
+    BACKOFF_LIMIT = 8.0
+
+    def __init__(self, smartroom, workers=2, size=4):
+        self.smartroom = smartroom
+        self.workers = workers
+        self.speeches = Queue.Queue(maxsize=size)
+        self.texts = Queue.Queue(maxsize=size)
+        self.responses = Queue.Queue(maxsize=size)
+        self.threads = list()
+        self.capturer = None
+        self.recognizers = list()
+        self.interpreter = None
+
+        self._active = Collections.Counter()
+        self._awake = False
+        self._lock = Threading.Lock()
+        self._stopped = Threading.Event()
+
+    @property
+    def stopped(self):
+        return self._stopped.is_set()
+
+    def run(self):
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            print(f"{self.__class__.__name__} was interrupted")
+        finally:
+            self.stop()
+            self.join()
+
+    def start(self):
+        self.recognizers = [
+            Threading.Thread(target=self.recognize, daemon=True)
+            for _ in range(self.workers)
+        ]
+        self.capturer = Threading.Thread(target=self.capture, daemon=True)
+        self.interpreter = Threading.Thread(target=self.interpret, daemon=True)
+        self.threads = [self.capturer]
+        self.threads += self.recognizers
+        self.threads += [self.interpreter, Threading.Thread(target=self.actuate, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+        self.indicate()
+
+    def stop(self):
+        self._stopped.set()
+
+    def join(self, timeout=None):
+        for thread in self.threads[1:]:
+            thread.join(timeout)
+
+    def capture(self):
+        sequence = 0
+        failures = 0
+        while not self.stopped:
+            try:
+                speech = self.smartroom.capture_speech()
+            except EOFError:
+                print(f"{self.__class__.__name__} reached the end of its audio source")
+                return
+            except Exception:
+                print(f"{self.__class__.__name__} failed to capture the spoken words")
+                failures += 1
+                self._stopped.wait(self.measure_backoff(failures))
+                continue
+            failures = 0
+            self.speeches.put((sequence, speech))
+            sequence += 1
+
+    def recognize(self):
+        upstream = lambda: self.stopped or not self.capturer.is_alive()
+        for sequence, speech in self.consume(self.speeches, self.RECOGNITION, upstream):
+            text = None
+            try:
+                text = self.smartroom.recognize_speech(speech)
+            except Exception:
+                print(f"{self.smartroom.__class__.__name__} failed to recognize the spoken words")
+            self.texts.put((sequence, text))
+
+    def interpret(self):
+        wake_word = self.smartroom.configurations["DEFAULT_WAKE_WORD"].lower()
+        sleep_words = self.smartroom.configurations["DEFAULT_SLEEP_WORDS"]
+
+        upstream = lambda: not any(recognizer.is_alive() for recognizer in self.recognizers)
+        for text in self.reorder(self.consume(self.texts, self.INTERPRETATION, upstream)):
+            if self.smartroom.detector is None and not self._awake:
+                self._awake = text.lower() == wake_word
+                continue
+            self._awake = False
+
+            print(text)
+            if text in sleep_words:
+                self.stop()
+                continue
+            if self.stopped:
+                continue
+            try:
+                plan = self.smartroom.perform_planning(text)
+                print(self.smartroom)
+            except self.smartroom.ParameterError as e:
+                print(e)
+                continue
+            except Exception:
+                print(f"{self.smartroom.__class__.__name__} failed to understand the words")
+                continue
+            self.responses.put(plan)
+
+    def actuate(self):
+        upstream = lambda: not self.interpreter.is_alive()
+        for plan in self.consume(self.responses, self.ACTUATION, upstream):
+            if plan.telegrams is not None:
+                self.smartroom.actuator.submit(plan.telegrams)
+        self.stop()
+
+    def measure_backoff(self, failures):
+        return min(self.BACKOFF * 2 ** (failures - 1), self.BACKOFF_LIMIT)
+
+    def reorder(self, items):
+        pending = dict()
+        expected = 0
+        for sequence, text in items:
+            pending[sequence] = text
+            while expected in pending:
+                text = pending.pop(expected)
+                expected += 1
+                if text is not None:
+                    yield text
+
+    def consume(self, queue, stage, upstream):
+        while True:
+            try:
+                item = queue.get(timeout=0.1)
+            except Queue.Empty:
+                if upstream() and queue.empty():
+                    return
+                continue
+
+            self.transition(stage, 1)
+            try:
+                yield item
+            finally:
+                self.transition(stage, -1)
+                queue.task_done()
+
+    def indicate(self):
+        if self._active[self.ACTUATION]:
+            self.smartroom.state = self.smartroom.KNXM
+        elif self._active[self.INTERPRETATION]:
+            self.smartroom.state = self.smartroom.NLPM
+        elif self._active[self.RECOGNITION]:
+            self.smartroom.state = self.smartroom.ASRM
+        elif self._awake:
+            self.smartroom.state = self.smartroom.WAKE
+        else:
+            self.smartroom.state = self.smartroom.IDLE
+
+    def transition(self, stage, delta):
+        with self._lock:
+            self._active[stage] += delta
+            self.indicate()
@@ -0,0 +1,79 @@
+import os as Os
+
+
+class Recognizer(object):
+    def __init__(self, recognizer, language="en-US"):
+        self.recognizer = recognizer
+        self.language = language
+
+    def recognize(self, speech):
+        raise NotImplementedError
+
+    @classmethod
+    def from_configurations(cls, recognizer, configurations, vocabulary):
+        return cls(recognizer, language=configurations.get("LANGUAGE", "en-US"))
+
+
+class GoogleRecognizer(Recognizer):
+    def recognize(self, speech):
+        return self.recognizer.recognize_google(speech, language=self.language)
+
+
+class SphinxRecognizer(Recognizer):
+    CLITICS = ("'", "n'")
+
+    def __init__(self, recognizer, language="en-US", grammar=None):
+        super().__init__(recognizer, language=language)
+        self.grammar = grammar
+
+    def recognize(self, speech):
+        return self.recognizer.recognize_sphinx(
+            speech,
+            language=self.language,
+            grammar=self.grammar
+        )
+
+    @classmethod
+    def from_configurations(cls, recognizer, configurations, vocabulary):
+        grammar = configurations.get("GRAMMAR")
+        if grammar:
+            cls.write_grammar(
+                grammar,
+                {word for word in vocabulary.words if word.isalpha()} | set(configurations.get("WORDS", list()))
+            )
+        return cls(
+            recognizer,
+            language=configurations.get("LANGUAGE", "en-US"),
+            grammar=grammar
+        )
+
+    @classmethod
+    def write_grammar(cls, path, words):
+        name, _ = Os.path.splitext(Os.path.basename(path))
+        alternatives = " | ".join(sorted(
+            word
+            for word in {word.lower() for word in words}
+            if word.replace("'", "").isalpha() and not word.startswith(cls.CLITICS)
+        ))
+        grammar = f"#JSGF V1.0;\ngrammar {name};\npublic <{name}> = ( {alternatives} )+ ;\n"
+
+        try:
+            with open(path) as file:
+                if file.read() == grammar:
+                    return path
+        except OSError:
+            pass
+
+        with open(path, "w") as file:
+            file.write(grammar)
+        try:
+            Os.remove(f"{Os.path.splitext(path)[0]}.fsg")
+        except OSError:
+            pass
+        return path
+
+
+RECOGNIZERS = {
+    "google": GoogleRecognizer,
+    "sphinx": SphinxRecognizer
+}
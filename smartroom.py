@@ -1,73 +1,122 @@
+import collections as Collections
+import concurrent.futures as Futures
+import functools as Functools
+import hashlib as Hashlib
 import json as Json
+import os as Os
+import pickle as Pickle
+import re as Re
 import requests as Requests
 import speech_recognition as Speech
-import yaml as Yaml
-
-from pixel_ring import pixel_ring as ReSpeaker
+import threading as Threading
+import types as Types
+
+from actuation import Actuator
+from audio import AudioStream, Calibrator, TemplateWakeWordDetector, VoiceActivityDetector
+from baos import Baos
+from cache import Cache
+from classifiers import ENGINES
+from config import Configuration, Watcher
+from devices import Indicator, NullSource, PixelRingIndicator, ReplaySource
+from metrics import Metrics
+from mirror import Mirror
+from recognizers import RECOGNIZERS
 from textblob import TextBlob as Text
 from textblob.classifiers import NaiveBayesClassifier as NaiveBayes
+from vocabulary import Vocabulary
 
 class Smartroom(object):
-    def __init__(self):
-        self._nouns = list()
-        self._verbs = list()
-        self._polarities = list()
-        self._response = dict()
-
-        self._text = None
-        self._tags = list()
-        self._words = list()
-        self._ngrams = list()
+    ANALYSIS_CACHE_SIZE = 1024
+    RESTART_SECTIONS = (
+        "ACTUATION",
+        "CALIBRATION",
+        "CLASSIFIER",
+        "DAEMON",
+        "DEFAULT_SLEEP_WORDS",
+        "DEFAULT_WAKE_WORD",
+        "DEVICES",
+        "KNX_BAOS_SERVER",
+        "METRICS",
+        "MICROPHONE_MODEL_NAME",
+        "MIRROR",
+        "PIPELINE",
+        "RELOAD",
+        "WAKE_WORD"
+    )
+
+    _worker = None
+
+    def __init__(self, indicator=None, source=None, configurations=None, classifier=None, session=None, metrics=None):
+        self._contexts = Threading.local()
 
         self._state = None
         self._classifier = None
+        self._revision = 0
 
         self._credentials = dict()
         self._telegram = dict()
 
-        self.WAKE = ReSpeaker.listen
-        self.ASRM = ReSpeaker.think
-        self.BACK = ReSpeaker.trace
-        self.IDLE = ReSpeaker.speak
-        self.KNXM = ReSpeaker.think
-        self.NLPM = ReSpeaker.spin
-        self.POST = Requests.post
-        self.PUTS = Requests.put
-
-        ReSpeaker.set_color_palette(0x6C3082, 0xDA70D6)
+        self.settings = self.build_settings(
+            self.get_configuration_file()
+            if configurations is None
+            else Configuration(configurations).validate()
+        )
+        self.indicator = indicator if indicator is not None else self.build_indicator()
+        self.WAKE = self.indicator.listen
+        self.ASRM = self.indicator.think
+        self.BACK = self.indicator.trace
+        self.IDLE = self.indicator.speak
+        self.KNXM = self.indicator.think
+        self.NLPM = self.indicator.spin
+
+        self.indicator.set_color_palette(0x6C3082, 0xDA70D6)
         self.state = self.NLPM
-        self.configurations = self.get_configuration_file()
-        self.microphone = Speech.Microphone(device_index=self.get_microphone_index())
+        self.load_tagger()
+        self.metrics = metrics if metrics is not None else self.build_metrics()
+        self.plans = self.build_plan_cache()
+        self.baos = Baos(
+            self.configurations["KNX_BAOS_SERVER"]["URL"],
+            self.credentials,
+            timeout=self.configurations["KNX_BAOS_SERVER"].get("TIMEOUT", (3.05, 5)),
+            expiry=self.configurations["KNX_BAOS_SERVER"].get("SESSION_EXPIRY", 600),
+            pool_size=self.configurations["KNX_BAOS_SERVER"].get("POOL_SIZE", 8),
+            session=session
+        )
+        self.POST = self.baos.session.post
+        self.PUTS = self.baos.session.put
+        self.GETS = self.baos.session.get
+        self.executor = Futures.ThreadPoolExecutor(
+            max_workers=self.configurations["KNX_BAOS_SERVER"].get("WORKERS", 4)
+        )
+        self._batch = self.configurations["KNX_BAOS_SERVER"].get("BATCH", False)
+        self.mirror = self.build_mirror()
+        self.actuator = self.build_actuator()
+        self.microphone = source if source is not None else self.build_source()
         self.recognizer = Speech.Recognizer()
-        self.classifier = NaiveBayes(
-            train_set=self.build_training_data(),
-            feature_extractor=self.extract_features
+        self.asr = self.build_recognizer()
+        self.stream = AudioStream(self.microphone)
+        self.calibrator = self.build_calibrator()
+        self.detector = self.build_wake_word_detector()
+        self.vad = self.build_voice_activity_detector()
+        self.classifier = classifier if classifier is not None else self.replay_updates(
+            self.build_classifier(self.load_classifier() or self.train_classifier())
         )
+        self.watcher = self.build_watcher() if configurations is None else None
         self.state = self.IDLE
 
     def __del__(self):
         print(f"{self.__class__.__name__} has been terminated")
 
-    def __response__(self, verbs=None, polarities=None):
-        verbs = verbs if verbs is not None and verbs else self.verbs
-        polarities = polarities if polarities is not None and polarities else self.polarities
-        response = dict()
-
-        try:
-            for i in range(len(self.nouns)):
-                response[self.nouns[i]] = (verbs[i], polarities[i])
-        except IndexError:
-            verb, *_ = verbs if verbs else "?"
-            polarity, *_ = polarities
-            response = {
-                self.nouns[i]: (verb, polarity)
-                for i in range(len(self.nouns))
-            }
-        self._response = response
-        return self._response
+    def __response__(self):
+        self.context.response = self.resolve(self.text)
+        return self.context.response
 
     def __str__(self):
-        return str(self._response)
+        return str(self.response)
+
+    @property
+    def analysis(self):
+        return self.context.analysis
 
     @property
     def classifier(self):
@@ -76,6 +125,23 @@ class Smartroom(object):
     @classifier.setter
     def classifier(self, value):
         self._classifier = value
+        self._revision = value.revision
+        self.plans.clear()
+
+    @property
+    def configurations(self):
+        return self.settings.configurations
+
+    @property
+    def context(self):
+        context = getattr(self._contexts, "context", None)
+        if context is None:
+            context = self._contexts.context = Smartroom.Context()
+        return context
+
+    @context.setter
+    def context(self, value):
+        self._contexts.context = value
 
     @property
     def credentials(self):
@@ -86,25 +152,28 @@ class Smartroom(object):
         return self._credentials
 
     @property
-    def ngrams(self, n=2):
-        self._ngrams = Text(self.text).ngrams(n=n)
-        return self._ngrams
+    def fingerprint(self):
+        return self.get_fingerprint(self.configurations)
+
+    @property
+    def ngrams(self):
+        return self.analysis.ngrams if self.analysis else tuple()
 
     @property
     def nouns(self):
-        return self._nouns
+        return self.context.nouns
 
     @nouns.setter
     def nouns(self, value):
-        self._nouns = value
+        self.context.nouns = value
 
     @property
     def polarities(self):
-        return self._polarities
+        return self.context.polarities
 
     @polarities.setter
     def polarities(self, value):
-        self._polarities = value
+        self.context.polarities = value
 
     @property
     def raw_response(self):
@@ -112,7 +181,7 @@ class Smartroom(object):
 
     @property
     def response(self):
-        return self._response
+        return self.context.response
 
     @property
     def state(self):
@@ -129,77 +198,225 @@ class Smartroom(object):
 
     @telegram.setter
     def telegram(self, value):
-        self._telegram = {
-            "command": self.configurations["COMMANDS"]["BAOS"],
-            "value": value
-        }
+        self._telegram = self.build_telegram(value)
 
     @property
     def text(self):
-        return self._text
+        return self.context.text
 
     @text.setter
+    @Metrics.timed("text")
     def text(self, value):
-        self._text = value
-
-        universal_parameters, *_ = self.configurations["PARAMETERS"]
-        self.nouns = [
-            " ".join((first_word, second_word))
-            for first_word, second_word in self.ngrams
-            if first_word in universal_parameters
-        ]
-
-        self.nouns += [
-            word
-            for word, tag in self.tags
-            if tag in self.configurations["NOUN_TAGS"]
-            and not [word for noun in self.nouns if word in noun]
-            and word in [
-                parameter
-                for parameters in self.configurations["PARAMETERS"]
-                for parameter in parameters
-                ]
-        ]
-
-        self.verbs.clear()
-        self.polarities.clear()
-        activation, deactivation = self.configurations["COMMANDS"]["WORDS"].values()
-
-        for word, tag in self.tags:
-            if tag in self.configurations["VERB_TAGS"]:
-                for activation_verb, deactivation_verb in zip(activation, deactivation):
-                    if word == activation_verb:
-                        self.verbs += [word]
-                        self.polarities += [1]
-                    elif word == deactivation_verb:
-                        if self.verbs and word in ["n't", "not"]:
-                            self.verbs.pop()
-                            self.polarities.pop()
-                        self.verbs += [word]
-                        self.polarities += [0]
-
-        if not (self.nouns and self.verbs and self.polarities):
-            self._response = "?"
-        else:
-            self._response = dict()
+        command = self.parse(value)
+        self.context = Smartroom.Context(
+            text=value,
+            analysis=self.analyze(value) if value else None,
+            nouns=list(command.nouns),
+            verbs=list(command.verbs),
+            polarities=list(command.polarities),
+            response="?" if not (command.nouns and command.verbs and command.polarities) else dict()
+        )
 
     @property
     def tags(self):
-        self._tags = Text(self.text).tags
-        return self._tags
+        return self.analysis.tags if self.analysis else tuple()
 
     @property
     def verbs(self):
-        return self._verbs
+        return self.context.verbs
 
     @verbs.setter
     def verbs(self, value):
-        self._verbs = value
+        self.context.verbs = value
+
+    @property
+    def vocabulary(self):
+        return self.settings.vocabulary
 
     @property
     def words(self):
-        self._words = Text(self.text).words
-        return self._words
+        return self.analysis.words if self.analysis else tuple()
+
+    def build_actuator(self):
+        configurations = self.configurations.get("ACTUATION", dict())
+        actuator = Actuator(
+            self,
+            retries=configurations.get("RETRIES", 3),
+            backoff=configurations.get("BACKOFF", 0.5),
+            dead_letters=configurations.get("DEAD_LETTERS")
+        )
+        actuator.start()
+        return actuator
+
+    def append_update(self, text, label):
+        path = self.get_classifier_path("UPDATES")
+        if not path:
+            return False
+        try:
+            with open(path, "a") as file:
+                file.write(Json.dumps({"text": text, "label": label}) + "\n")
+        except OSError:
+            print(f"{self.__class__.__name__} failed to log its classifier update")
+            return False
+        return True
+
+    def build_calibrator(self):
+        configurations = self.configurations.get("CALIBRATION", dict())
+        with self.stream as input:
+            self.recognizer.adjust_for_ambient_noise(
+                input,
+                duration=configurations.get("DURATION", 1)
+            )
+
+        return Calibrator(
+            self.recognizer,
+            interval=configurations.get("INTERVAL", 30),
+            duration=configurations.get("SAMPLE", 0.25)
+        )
+
+    def build_classifier(self, classifier):
+        engine = self.configurations["CLASSIFIER"].get("ENGINE", "naive_bayes")
+        if engine not in ENGINES:
+            raise Smartroom.ParameterError(
+                f"{self.__class__.__name__} received an unknown classifier engine"
+            )
+        return ENGINES[engine](classifier)
+
+    def build_indicator(self):
+        if self.configurations.get("DEVICES", dict()).get("INDICATOR", "respeaker") != "respeaker":
+            return Indicator()
+        try:
+            return PixelRingIndicator()
+        except Exception:
+            print(f"{self.__class__.__name__} failed to find its ReSpeaker")
+            return Indicator()
+
+    def build_metrics(self):
+        configurations = self.configurations.get("METRICS", dict())
+        return Metrics.from_configurations(
+            configurations,
+            labels=dict(room=configurations.get("ROOM", "default"))
+        )
+
+    def build_mirror(self):
+        configurations = self.configurations.get("MIRROR", dict())
+        if not configurations.get("ENABLED", False):
+            return None
+
+        mirror = Mirror(
+            self,
+            interval=configurations.get("INTERVAL", 30),
+            max_age=configurations.get("MAX_AGE", 60)
+        )
+        mirror.start()
+        return mirror
+
+    def build_plan_cache(self):
+        configurations = self.configurations.get("CACHE", dict())
+        return Cache(
+            size=configurations.get("SIZE", 256),
+            ttl=configurations.get("TTL")
+        )
+
+    def build_recognizer(self):
+        configurations = self.configurations.get("RECOGNIZER", dict())
+        engine = configurations.get("ENGINE", "google")
+        if engine not in RECOGNIZERS:
+            raise Smartroom.ParameterError(
+                f"{self.__class__.__name__} received an unknown recognizer engine"
+            )
+        return RECOGNIZERS[engine].from_configurations(
+            self.recognizer,
+            configurations,
+            self.vocabulary
+        )
+
+    def build_settings(self, configurations, generation=0):
+        return Smartroom.Settings(configurations, Vocabulary(configurations), generation)
+
+    def build_source(self):
+        configurations = self.configurations.get("DEVICES", dict())
+        source = configurations.get("SOURCE", "microphone")
+        if source == "replay":
+            return ReplaySource.from_directory(
+                configurations["REPLAY"],
+                sample_rate=self.configurations.get("WAKE_WORD", dict()).get("SAMPLE_RATE", 16000)
+            )
+        if source == "none":
+            return NullSource()
+        return Speech.Microphone(device_index=self.get_microphone_index())
+
+    def build_telegram(self, value):
+        return {
+            "command": self.configurations["COMMANDS"]["BAOS"],
+            "value": value
+        }
+
+    def build_telegrams(self, response=None):
+        response = self.response if response is None else response
+        routes = self.vocabulary.routes
+        telegrams = dict()
+        for parameter, (action, state) in response.items():
+            if parameter not in routes:
+                raise NotImplementedError
+            for datapoint in routes[parameter]:
+                if state is None:
+                    telegrams.pop(datapoint, None)
+                else:
+                    telegrams[datapoint] = False if state == 0 else True
+        return telegrams
+
+    def build_watcher(self):
+        configurations = self.configurations.get("RELOAD", dict())
+        if not configurations.get("ENABLED", False):
+            return None
+
+        watcher = Watcher(
+            self.get_configuration_path(),
+            self.reload,
+            interval=configurations.get("INTERVAL", 2)
+        )
+        watcher.start()
+        return watcher
+
+    def build_voice_activity_detector(self):
+        configurations = self.configurations.get("VAD", dict())
+        if not configurations.get("ENABLED", False):
+            return None
+
+        return VoiceActivityDetector(
+            self.recognizer,
+            frame=configurations.get("FRAME", 0.02),
+            onset=configurations.get("ONSET", 0.06),
+            pre_roll=configurations.get("PRE_ROLL", 0.3),
+            silence=configurations.get("SILENCE", 0.6),
+            maximum=configurations.get("MAXIMUM", 8.0),
+            padding=configurations.get("PADDING", 0.1),
+            calibrator=self.calibrator
+        )
+
+    def build_wake_word_detector(self):
+        configurations = self.configurations.get("WAKE_WORD", dict())
+        if configurations.get("ENGINE", "google") != "template":
+            return None
+        if not configurations.get("TEMPLATES"):
+            print(f"{self.__class__.__name__} has no wake word templates to match")
+            return None
+
+        return TemplateWakeWordDetector(
+            self.recognizer,
+            configurations["TEMPLATES"],
+            threshold=configurations.get("THRESHOLD", TemplateWakeWordDetector.THRESHOLD),
+            sample_rate=configurations.get("SAMPLE_RATE", 16000),
+            calibrator=self.calibrator
+        )
+
+    def build_test_data(self):
+        return [
+            (text, label)
+            for label, texts in self.configurations["TEST_DATA"].items()
+            for text in texts
+        ]
 
     def build_training_data(self):
         return [
@@ -208,106 +425,529 @@ class Smartroom(object):
             for text in texts
         ]
 
+    def canonicalize(self, text):
+        fillers = self.vocabulary.fillers
+        return " ".join(
+            word
+            for word in Re.sub(r"[^\w\s']", " ", str(text).lower()).split()
+            if word not in fillers
+        )
+
+    def classify(self, text, labels=None):
+        command = self.parse(text)
+        response = self.resolve(command.text, is_naive=True, labels=labels)
+        return command._replace(response=tuple(response.items()))
+
+    def classify_many(self, texts, processes=None, chunksize=64):
+        texts = list(texts)
+        if processes:
+            return self.map_in_workers(Smartroom.classify_in_worker, texts, processes, chunksize)
+        clauses = [self.segment(text) for text in texts]
+        labels = iter(self.classifier.classify_many([
+            clause.text
+            for segments in clauses
+            for clause in segments
+        ]))
+        return [
+            self.classify(text, labels=[next(labels) for _ in segments])
+            for text, segments in zip(texts, clauses)
+        ]
+
+    def close(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.actuator.close()
+        if self.mirror is not None:
+            self.mirror.stop()
+        self.metrics.close()
+        self.stream.close()
+        self.executor.shutdown()
+        self.baos.close()
+
+    def capture_speech(self):
+        with self.stream as input:
+            if self.detector is not None:
+                self.detector.detect(input)
+                self.state = self.WAKE
+            return self.listen(input)
+
+    def compact_classifier(self):
+        with self.classifier.learning:
+            classifier = self.classifier.classifier
+            classifier.classifier = self.classifier.export()
+            if not self.save_classifier(classifier):
+                return False
+
+            path = self.get_classifier_path("UPDATES")
+            try:
+                if path:
+                    open(path, "w").close()
+            except OSError:
+                print(f"{self.__class__.__name__} failed to truncate its classifier updates")
+                return False
+            self.classifier.updates = 0
+            return True
+
+    @Metrics.timed("speech_to_text")
     def convert_speech_to_text(self):
         try:
-            with self.microphone as input:
-                self.recognizer.adjust_for_ambient_noise(input)
-                speech = self.recognizer.listen(input)
-            self.state = self.ASRM
-            self.text = self.recognizer.recognize_google(speech)
-            self.state = self.IDLE
-            return self.text
-        except Speech.RequestError:
-            print(f"{self.__class__.__name__} failed to communicate with API")
-            return None
-        except Speech.UnknownValueError:
-            print(f"{self.__class__.__name__} failed to hear the spoken words")
-            return None
+            with self.stream as input:
+                speech = self.listen(input)
         except KeyboardInterrupt:
             print(f"{self.__class__.__name__} failed to complete on time")
             return None
 
+        self.state = self.ASRM
+        text = self.recognize_speech(speech)
+        if text is None:
+            return None
+        self.text = text
+        self.state = self.IDLE
+        return self.text
+
     def extract_features(self, document, tokens):
         return {
             f"contains({word})": word in tokens
-            for word, tag in Text(document).tags
-            if tag in self.configurations["VERB_TAGS"]
+            for word, tag in self.analyze(document).tags
+            if tag in self.vocabulary.verb_tags
         }
 
+    def get_classifier_path(self, key):
+        path = self.configurations["CLASSIFIER"].get(key)
+        if not path:
+            return None
+        root, extension = Os.path.splitext(path)
+        return f"{root}.{self.fingerprint[:12]}{extension}"
+
     def get_microphone_index(self):
-        microphone_index, = [
-            index
-            for index, name in enumerate(Speech.Microphone.list_microphone_names())
-            if self.configurations["MICROPHONE_MODEL_NAME"].lower() in name.lower()
+        configurations = self.configurations.get("DEVICES", dict())
+        if configurations.get("MICROPHONE_INDEX") is not None:
+            return configurations["MICROPHONE_INDEX"]
+
+        model = (configurations.get("MICROPHONE") or self.configurations["MICROPHONE_MODEL_NAME"]).lower()
+        names = Speech.Microphone.list_microphone_names()
+        indices = [index for index, name in enumerate(names) if model == name.lower()] or [
+            index for index, name in enumerate(names) if model in name.lower()
         ]
-        return microphone_index
+        if len(indices) != 1:
+            raise Smartroom.ParameterError(
+                f"{self.__class__.__name__} found {len(indices)} microphones matching {model}; "
+                f"set DEVICES.MICROPHONE or DEVICES.MICROPHONE_INDEX"
+            )
+        return indices[0]
 
-    def perform_classification(self, is_naive=False):
-        self.state = self.NLPM
-        verbs = self.verbs
-        polarities = self.polarities
+    def learn(self, text, label):
+        if label not in self.classifier.labels():
+            raise Smartroom.ParameterError(f"{self.__class__.__name__} received an unknown label")
 
-        if set(["n't", "not"]).intersection(self.verbs):
-            verbs = list(self.verbs)
-            polarities = list(self.polarities)
+        with self.classifier.learning:
             try:
-                i = self.verbs.index("n't")
-            except ValueError:
-                i = self.verbs.index("not")
-            verbs.pop(i)
-            polarities.pop(i)
-            verbs[i] = f"!{verbs[i]}"
-
-            if is_naive:
-                polarities[i] = 0 if self.classifier.classify(self.text) > 0 else 1
-            else:
-                polarities[i] = 0 if polarities[i] > 0 else 1
-        elif is_naive:
-            self.polarities = [self.classifier.classify(self.text)]
+                self.classifier.update(text, label)
+            except NotImplementedError:
+                raise Smartroom.ParameterError(
+                    f"{self.__class__.__name__} cannot learn with its classifier engine"
+                )
+            self.plans.clear()
+            if self.append_update(text, label):
+                self.classifier.updates += 1
+            if self.classifier.updates >= self.configurations["CLASSIFIER"].get("COMPACT", 100):
+                self.compact_classifier()
+
+    def listen(self, source):
+        if self.vad is not None:
+            speech = self.vad.listen(source)
+        else:
+            speech = self.recognizer.listen(
+                source,
+                phrase_time_limit=self.configurations.get("VAD", dict()).get("MAXIMUM")
+            )
+        self.metrics.observe("utterance", len(speech.frame_data) / (speech.sample_rate * speech.sample_width))
+        return speech
+
+    def load_classifier(self):
+        try:
+            with open(self.get_classifier_path("SNAPSHOT"), "rb") as file:
+                fingerprint, model, word_set = Pickle.load(file)
+        except (OSError, EOFError, ValueError, Pickle.UnpicklingError):
+            return None
+        except (AttributeError, ImportError):
+            print(f"{self.__class__.__name__} found an incompatible classifier snapshot")
+            return None
+
+        if fingerprint != self.fingerprint:
+            print(f"{self.__class__.__name__} found a stale classifier snapshot")
+            return None
 
+        return self.restore_classifier(model, word_set)
+
+    def load_tagger(self):
+        return self.analyze(self.configurations["DEFAULT_WAKE_WORD"]).tags
+
+    def map_in_workers(self, function, texts, processes, chunksize=64):
+        with Futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=Smartroom.initialize_worker,
+            initargs=(self.configurations, self.classifier.export(), self.classifier.classifier._word_set)
+        ) as executor:
+            return list(executor.map(function, texts, chunksize=chunksize))
+
+    def parse(self, text):
+        vocabulary = self.vocabulary
+        tags = self.analyze(text).tags if text else tuple()
+        verbs, polarities = vocabulary.extract_verbs(tags)
+        return Smartroom.Command(
+            text,
+            tuple(vocabulary.extract_nouns(tags)),
+            tuple(verbs),
+            tuple(polarities),
+            tuple()
+        )
+
+    def parse_many(self, texts, processes=None, chunksize=64):
+        texts = list(texts)
+        if processes:
+            return self.map_in_workers(Smartroom.parse_in_worker, texts, processes, chunksize)
+        return [self.parse(text) for text in texts]
+
+    @Metrics.timed("classification")
+    def perform_classification(self, is_naive=False):
+        self.state = self.NLPM
+        self.context.response = self.resolve(self.text, is_naive=is_naive)
         self.state = self.IDLE
-        return self.__response__(verbs=verbs, polarities=polarities)
+        return self.context.response
+
+    def perform_dispatch(self, response=None):
+        return self.perform_requests(self.build_telegrams(response))
+
+    def perform_interpretation(self, text):
+        self.text = text
+        if self.response:
+            try:
+                self.perform_naive_bayes_classification()
+            except Exception:
+                self.throw_parameter_exception()
+        else:
+            self.perform_classification()
+            self.perform_naive_bayes_classification()
+        return self.response
+
+    @Metrics.timed("planning")
+    def perform_planning(self, text):
+        if self.classifier.revision != self._revision:
+            self._revision = self.classifier.revision
+            self.plans.clear()
+
+        plans = self.plans
+        canonical = self.canonicalize(text)
+        key = (self.settings.generation, self.classifier.revision, canonical)
+        plan = plans.get(key)
+        if plan is not None:
+            self.metrics.increment("plan_cache_hits")
+            self.context = Smartroom.Context(text=text, response=dict(plan.response))
+            return plan
+
+        self.metrics.increment("plan_cache_misses")
+        response = dict(self.perform_interpretation(canonical))
+        try:
+            telegrams = Types.MappingProxyType(self.build_telegrams(response))
+        except NotImplementedError:
+            telegrams = None
+        plan = Smartroom.Plan(Types.MappingProxyType(response), telegrams)
+        return plans.put(key, plan) if response else plan
 
     def perform_naive_bayes_classification(self):
         return self.perform_classification(is_naive=True)
 
+    @Metrics.timed("request")
     def perform_request(self, method, link, payload=None, key=None):
         try:
-            response = method(
-                f"{self.configurations['KNX_BAOS_SERVER']['URL']}{link}",
-                cookies=key,
-                data=Json.dumps(payload)
-            )
-        except Exception:
-            raise NotImplementedError
+            response = self.baos.request(method, link, payload, key)
+        except Exception as error:
+            raise NotImplementedError from error
 
         self.verify_status_code(response)
         return response
 
+    def perform_requests(self, telegrams):
+        telegrams = dict(telegrams)
+        if self.mirror is not None:
+            changes = self.mirror.filter(telegrams)
+            self.metrics.increment("telegrams_suppressed", len(telegrams) - len(changes))
+            telegrams = changes
+        if not telegrams:
+            return dict()
+
+        errors = self.send_telegrams(telegrams)
+        if self.mirror is not None:
+            self.mirror.update({
+                datapoint: value
+                for datapoint, value in telegrams.items()
+                if errors[datapoint] is None
+            })
+        return errors
+
+    def send_telegrams(self, telegrams):
+        if self._batch:
+            try:
+                self.perform_request(self.PUTS, "datapoints", [
+                    dict(datapoint=datapoint, **self.build_telegram(value))
+                    for datapoint, value in telegrams.items()
+                ])
+                return dict.fromkeys(telegrams)
+            except Requests.HTTPError:
+                print(f"{self.__class__.__name__} fell back to single datapoint requests")
+                self._batch = False
+            except NotImplementedError:
+                pass
+
+        futures = {
+            datapoint: self.executor.submit(
+                self.perform_request,
+                self.PUTS,
+                f"datapoints/{datapoint}",
+                self.build_telegram(value)
+            )
+            for datapoint, value in telegrams.items()
+        }
+
+        errors = dict()
+        for datapoint, future in futures.items():
+            try:
+                future.result()
+                errors[datapoint] = None
+            except Exception as error:
+                errors[datapoint] = error
+        return errors
+
+    def reload(self, configurations=None):
+        configurations = (
+            self.get_configuration_file()
+            if configurations is None
+            else Configuration(configurations).validate()
+        )
+        if self.get_fingerprint(configurations) != self.fingerprint:
+            print(f"{self.__class__.__name__} needs retraining before its commands can change")
+            return False
+
+        current = self.settings.configurations
+        restart = [
+            section
+            for section in self.RESTART_SECTIONS
+            if configurations.get(section) != current.get(section)
+        ]
+        if restart:
+            print(f"{self.__class__.__name__} needs a restart to apply {', '.join(restart)}")
+            data = configurations.thaw()
+            for section in restart:
+                data.pop(section, None)
+                if section in current:
+                    data[section] = Configuration.thaw_value(current[section])
+            configurations = Configuration(data).validate()
+
+        self.settings = self.build_settings(configurations, self.settings.generation + 1)
+        if configurations.get("CACHE") != current.get("CACHE"):
+            self.plans = self.build_plan_cache()
+        else:
+            self.plans.clear()
+        if configurations.get("VAD") != current.get("VAD"):
+            self.vad = self.build_voice_activity_detector()
+        self.asr = self.build_recognizer()
+        print(f"{self.__class__.__name__} reloaded its configuration file")
+        return True
+
+    def replay_updates(self, classifier):
+        path = self.get_classifier_path("UPDATES")
+        try:
+            with open(path) as file:
+                lines = file.readlines()
+        except (OSError, TypeError):
+            return classifier
+
+        for line in lines:
+            try:
+                update = Json.loads(line)
+                classifier.update(update["text"], update["label"])
+            except NotImplementedError:
+                print(f"{self.__class__.__name__} cannot replay classifier updates with its engine")
+                return classifier
+            except (KeyError, TypeError, ValueError):
+                print(f"{self.__class__.__name__} skipped a malformed classifier update")
+                continue
+            classifier.updates += 1
+        return classifier
+
+    def restore_classifier(self, model, word_set):
+        classifier = NaiveBayes(train_set=list(), feature_extractor=self.extract_features)
+        classifier._word_set = word_set
+        classifier.classifier = model
+        return classifier
+
+    def resolve(self, text, is_naive=False, labels=None):
+        clauses = self.segment(text)
+        if is_naive and labels is None:
+            labels = self.classifier.classify_many([clause.text for clause in clauses])
+        response = dict()
+        action, state = None, None
+
+        for i, clause in enumerate(clauses):
+            if clause.negated and clause.verb is None and action is not None:
+                for noun in clause.nouns:
+                    response.pop(noun, None)
+                    response[noun] = (f"!{action.lstrip('!')}", None)
+                continue
+
+            if clause.verb is not None or action is None:
+                if clause.verb is not None:
+                    action, state = clause.verb, labels[i] if is_naive else clause.polarity
+                elif is_naive and clause.nouns:
+                    action, state = "?", labels[i]
+                else:
+                    continue
+                if clause.negated:
+                    action, state = f"!{action}", 0 if state > 0 else 1
+
+            for noun in clause.nouns:
+                response.pop(noun, None)
+                response[noun] = (action, state)
+
+        return response
+
+    def segment(self, text):
+        return self.vocabulary.segment(self.analyze(text).tags if text else tuple())
+
+    @Metrics.timed("recognition")
+    def recognize_speech(self, speech):
+        try:
+            return self.asr.recognize(speech)
+        except Speech.RequestError:
+            print(f"{self.__class__.__name__} failed to communicate with API")
+            return None
+        except Speech.UnknownValueError:
+            print(f"{self.__class__.__name__} failed to hear the spoken words")
+            return None
+        except KeyboardInterrupt:
+            print(f"{self.__class__.__name__} failed to complete on time")
+            return None
+
+    def save_classifier(self, classifier):
+        snapshot = self.get_classifier_path("SNAPSHOT")
+        try:
+            with open(f"{snapshot}.tmp", "wb") as file:
+                Pickle.dump(
+                    (self.fingerprint, classifier.classifier, classifier._word_set),
+                    file
+                )
+            Os.replace(f"{snapshot}.tmp", snapshot)
+        except OSError:
+            print(f"{self.__class__.__name__} failed to save its classifier snapshot")
+            return False
+        return True
+
+    def train_classifier(self):
+        classifier = NaiveBayes(
+            train_set=self.build_training_data(),
+            feature_extractor=self.extract_features
+        )
+        classifier.train()
+        self.save_classifier(classifier)
+        return classifier
+
     def wait_for_wake_word(self, wake_word):
-        while self.convert_speech_to_text() != wake_word.lower():
+        if self.detector is not None:
             self.state = self.IDLE
+            with self.stream as input:
+                self.detector.detect(input)
+        else:
+            while self.convert_speech_to_text() != wake_word.lower():
+                self.state = self.IDLE
 
         self.state = self.WAKE
         return self.convert_speech_to_text()
 
+    @classmethod
+    def analyze(cls, text):
+        return cls.get_analysis(cls.normalize(text))
+
+    @staticmethod
+    def classify_in_worker(text):
+        return Smartroom._worker.classify(text)
+
+    @staticmethod
+    def initialize_worker(configurations, model, word_set):
+        worker = Smartroom.__new__(Smartroom)
+        worker._contexts = Threading.local()
+        worker.settings = worker.build_settings(configurations)
+        worker._classifier = worker.build_classifier(worker.restore_classifier(model, word_set))
+        Smartroom._worker = worker
+
+    @staticmethod
+    def parse_in_worker(text):
+        return Smartroom._worker.parse(text)
+
     @classmethod
     def get_configuration_file(cls):
-        try:
-            with open(f"{str(cls.__name__).lower()}.yaml") as file:
-                return Yaml.full_load(file)
-        except OSError:
-            print(f"{cls.__name__} failed to locate its configuration file")
-            return None
+        return Configuration.load(cls.get_configuration_path())
+
+    @classmethod
+    def get_configuration_path(cls):
+        return f"{str(cls.__name__).lower()}.yaml"
+
+    @classmethod
+    def get_fingerprint(cls, configurations):
+        sections = {
+            section: Configuration.thaw_value(configurations[section])
+            for section in ("COMMANDS", "VERB_TAGS")
+        }
+        return Hashlib.sha256(
+            Json.dumps(sections, sort_keys=True, default=str).encode()
+        ).hexdigest()
 
     @classmethod
     def verify_status_code(cls, response):
         if response.status_code not in (Requests.codes.ok, Requests.codes.no_content):
             response.raise_for_status()
 
+    @classmethod
+    def normalize(cls, text):
+        return " ".join(str(text).split())
+
+    @staticmethod
+    @Functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+    def get_analysis(text):
+        return Smartroom.Analysis(text)
+
     @classmethod
     def throw_parameter_exception(cls):
         raise Smartroom.ParameterError(f"{cls.__name__} received bad input")
 
+    class Analysis(object):
+        def __init__(self, text):
+            blob = Text(text)
+            self.text = text
+            self.tags = tuple(blob.tags)
+            self.words = tuple(blob.words)
+            self.ngrams = tuple(tuple(ngram) for ngram in blob.ngrams(n=2))
+
+    class Command(Collections.namedtuple(
+        "Command",
+        ("text", "nouns", "verbs", "polarities", "response")
+    )):
+        __slots__ = ()
+
+    class Context(object):
+        def __init__(self, text=None, analysis=None, nouns=None, verbs=None, polarities=None, response=None):
+            self.text = text
+            self.analysis = analysis
+            self.nouns = nouns if nouns is not None else list()
+            self.verbs = verbs if verbs is not None else list()
+            self.polarities = polarities if polarities is not None else list()
+            self.response = response if response is not None else dict()
+
     class ParameterError(Exception):
         pass
+
+    class Plan(Collections.namedtuple("Plan", ("response", "telegrams"))):
+        __slots__ = ()
+
+    class Settings(Collections.namedtuple("Settings", ("configurations", "vocabulary", "generation"))):
+        __slots__ = ()
@@ -0,0 +1,131 @@
+import os as Os
+import re as Re
+import sys as Sys
+import types as Types
+
+import pytest
+
+ROOT = Os.path.dirname(Os.path.dirname(Os.path.abspath(__file__)))
+Sys.path.insert(0, ROOT)
+
+import classifiers
+import textblob.classifiers
+
+from config import Configuration
+from devices import Indicator, NullSource
+from smartroom import Smartroom
+
+TAGS = {
+    "activate": "VB", "close": "VB", "open": "VB", "shut": "VB", "shutdown": "VB",
+    "switch": "VB", "turn": "VB", "do": "VBP", "does": "VBZ", "did": "VBD",
+    "on": "RP", "off": "RP", "down": "RP", "up": "RP", "n't": "RB", "not": "RB",
+    "all": "DT", "every": "DT", "the": "DT", "and": "CC", "but": "CC", "or": "CC",
+    "then": "RB", "please": "UH", "hello": "UH", "there": "RB", "lights": "NNS"
+}
+
+
+def tokenize(text, include_punc=True):
+    return [
+        word
+        for word in Re.findall(r"\w+(?=n't)|n't|\w+|'\w+|[^\w\s]", str(text))
+        if include_punc or word[0].isalnum() or word[0] == "'"
+    ]
+
+
+def tag(text):
+    return tuple((word, TAGS.get(word.lower(), "NN")) for word in tokenize(text))
+
+
+def analyze(text):
+    tags = tag(text)
+    return Types.SimpleNamespace(
+        text=text,
+        tags=tags,
+        words=tuple(word for word, _ in tags),
+        ngrams=tuple(zip([word for word, _ in tags], [word for word, _ in tags][1:]))
+    )
+
+
+class Room(object):
+    ParameterError = Smartroom.ParameterError
+
+    def __init__(self, speeches, failures=0):
+        self.configurations = {"DEFAULT_WAKE_WORD": "Luna", "DEFAULT_SLEEP_WORDS": ("goodbye",)}
+        self.detector = object()
+        self.state = None
+        self.ASRM = self.BACK = self.IDLE = self.KNXM = self.NLPM = self.WAKE = None
+        self.speeches = list(speeches)
+        self.failures = failures
+        self.captures = 0
+        self.submitted = list()
+        self.actuator = self
+
+    def capture_speech(self):
+        self.captures += 1
+        if self.failures:
+            self.failures -= 1
+            raise OSError("the microphone is unplugged")
+        if not self.speeches:
+            raise EOFError("the recordings ran out")
+        return self.speeches.pop(0)
+
+    def perform_planning(self, text):
+        return Smartroom.Plan({text: ("on", 1)}, {text: True})
+
+    def recognize_speech(self, speech):
+        return speech
+
+    def submit(self, telegrams):
+        self.submitted += [dict(telegrams)]
+
+
+@pytest.fixture
+def build_room():
+    return Room
+
+
+@pytest.fixture(scope="session")
+def configurations():
+    return Configuration.load(Os.path.join(ROOT, "smartroom.yaml"))
+
+
+@pytest.fixture
+def tagger(monkeypatch):
+    monkeypatch.setattr(Smartroom, "get_analysis", staticmethod(analyze))
+    monkeypatch.setattr(textblob.classifiers, "word_tokenize", tokenize)
+    monkeypatch.setattr(classifiers, "word_tokenize", tokenize)
+    return tag
+
+
+@pytest.fixture
+def build_smartroom(tagger, configurations, tmp_path):
+    smartrooms = list()
+
+    def build(overlay=None, **kwargs):
+        kwargs.setdefault("indicator", Indicator())
+        kwargs.setdefault("source", NullSource())
+        smartroom = Smartroom(
+            configurations=configurations.merge({
+                "ACTUATION": {"DEAD_LETTERS": None},
+                "CALIBRATION": {"DURATION": 0.1},
+                "CLASSIFIER": {
+                    "SNAPSHOT": str(tmp_path / "smartroom.pickle"),
+                    "UPDATES": str(tmp_path / "smartroom.updates.jsonl")
+                },
+                "METRICS": {"ENABLED": False},
+                "MIRROR": {"ENABLED": False},
+                "RECOGNIZER": {"ENGINE": "google"}
+            }).merge(overlay or dict()),
+            **kwargs
+        )
+        smartrooms.append(smartroom)
+        return smartroom
+
+    yield build
+    for smartroom in smartrooms:
+        smartroom.close()
+
+
+@pytest.fixture
+def smartroom(build_smartroom):
+    return build_smartroom()
@@ -0,0 +1,87 @@
+import json as Json
+import threading as Threading
+
+import pytest
+
+from actuation import Actuator
+from metrics import Metrics
+
+
+class Room(object):
+    def __init__(self, failures=0, gate=None):
+        self.metrics = Metrics(enabled=True)
+        self.failures = failures
+        self.gate = gate
+        self.writes = list()
+
+    def perform_requests(self, telegrams):
+        self.writes += [dict(telegrams)]
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.failures:
+            self.failures -= 1
+            return dict.fromkeys(telegrams, NotImplementedError())
+        return dict.fromkeys(telegrams)
+
+
+@pytest.fixture
+def build():
+    actuators = list()
+
+    def build(room, **kwargs):
+        actuator = Actuator(room, **kwargs)
+        actuator.start()
+        actuators.append(actuator)
+        return actuator
+
+    yield build
+    for actuator in actuators:
+        actuator.close()
+
+
+def test_writes_submitted_telegrams(build):
+    room = Room()
+    actuator = build(room)
+    actuator.submit({1: True, 2: False})
+    assert actuator.wait(5)
+    assert room.writes == [{1: True, 2: False}]
+
+
+def test_coalesces_writes_to_the_same_datapoint(build):
+    gate = Threading.Event()
+    room = Room(gate=gate)
+    actuator = build(room)
+
+    actuator.submit({1: True})
+    while not room.writes:
+        Threading.Event().wait(0.01)
+    actuator.submit({2: True})
+    actuator.submit({2: False})
+    gate.set()
+
+    assert actuator.wait(5)
+    assert room.writes == [{1: True}, {2: False}]
+    assert room.metrics.counters["actuation_coalesced"] == 1
+
+
+def test_retries_failed_writes(build):
+    room = Room(failures=1)
+    actuator = build(room, retries=3, backoff=0.01)
+    actuator.submit({1: True})
+
+    assert actuator.wait(5)
+    assert room.writes == [{1: True}, {1: True}]
+    assert room.metrics.counters["actuation_retries"] == 1
+
+
+def test_buries_writes_that_keep_failing(build, tmp_path):
+    room = Room(failures=10)
+    dead_letters = tmp_path / "deadletters.jsonl"
+    actuator = build(room, retries=2, backoff=0.01, dead_letters=str(dead_letters))
+    actuator.submit({1: True})
+
+    assert actuator.wait(5)
+    assert len(room.writes) == 3
+    letter, = [Json.loads(line) for line in dead_letters.read_text().splitlines()]
+    assert (letter["datapoint"], letter["value"], letter["attempts"]) == (1, True, 3)
+    assert room.metrics.counters["actuation_dead_letters"] == 1
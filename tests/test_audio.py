@@ -0,0 +1,86 @@
+import io as Io
+
+import numpy as Numpy
+import pytest
+import speech_recognition as Speech
+
+from audio import Calibrator, VoiceActivityDetector
+
+
+class Source(Speech.AudioSource):
+    CHUNK = 1024
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+
+    def __init__(self, samples):
+        self.stream = Source.Stream(Io.BytesIO(samples.astype("<i2").tobytes()))
+
+    class Stream(object):
+        def __init__(self, buffer):
+            self.buffer = buffer
+
+        def read(self, size):
+            return self.buffer.read(2 * size)
+
+
+def build_recognizer(threshold):
+    recognizer = Speech.Recognizer()
+    recognizer.energy_threshold = threshold
+    return recognizer
+
+
+def test_trim_keeps_voiced_frames_with_padding():
+    samples = Numpy.arange(40)
+    frames = [(10, False), (10, True), (10, True), (10, False)]
+    assert list(VoiceActivityDetector.trim(samples, frames, padding=5)) == list(range(5, 35))
+
+
+def test_trim_keeps_unvoiced_segments_whole():
+    samples = Numpy.arange(20)
+    assert list(VoiceActivityDetector.trim(samples, [(10, False), (10, False)])) == list(range(20))
+
+
+def test_listen_captures_the_spoken_segment():
+    random = Numpy.random.default_rng(0)
+    samples = Numpy.concatenate([
+        random.normal(0, 100, 16000),
+        random.normal(0, 8000, 8000),
+        random.normal(0, 100, 24000)
+    ])
+    detector = VoiceActivityDetector(build_recognizer(1000), silence=0.3, padding=0.1)
+    speech = detector.listen(Source(samples))
+
+    seconds = len(speech.frame_data) / (speech.sample_rate * speech.sample_width)
+    assert 0.5 <= seconds <= 0.5 + 2 * 0.1 + 0.1
+
+
+def test_listen_times_out_on_silence():
+    detector = VoiceActivityDetector(build_recognizer(1000))
+    with pytest.raises(Speech.WaitTimeoutError):
+        detector.listen(Source(Numpy.zeros(16000)))
+
+
+def test_calibrator_follows_quiet_frames_and_ignores_speech():
+    recognizer = build_recognizer(3000)
+    calibrator = Calibrator(recognizer, interval=0, duration=0.1)
+
+    assert calibrator.observe(5000, 0.1) == 3000
+    assert calibrator.observe(100, 0.05) == 3000
+    assert calibrator.observe(100, 0.05) < 3000
+
+
+def test_calibrator_waits_for_its_interval():
+    recognizer = build_recognizer(3000)
+    calibrator = Calibrator(recognizer, interval=60, duration=0.1)
+    calibrator.observe(100, 0.2)
+    assert recognizer.energy_threshold == 3000
+
+
+def test_voice_activity_detector_recalibrates_from_quiet_frames():
+    recognizer = build_recognizer(3000)
+    detector = VoiceActivityDetector(recognizer, calibrator=Calibrator(recognizer, interval=0, duration=0.25))
+    noise = Numpy.random.default_rng(0).normal(0, 100, 16000)
+
+    with pytest.raises(Speech.WaitTimeoutError):
+        detector.listen(Source(noise))
+    assert recognizer.energy_threshold < 3000
@@ -0,0 +1,45 @@
+import types as Types
+
+import cache as Module
+
+from cache import Cache
+
+
+def test_evicts_the_least_recently_used_entry():
+    cache = Cache(size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expires_entries_after_their_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(Module, "Time", Types.SimpleNamespace(monotonic=lambda: now[0]))
+    cache = Cache(size=2, ttl=10)
+    cache.put("a", 1)
+
+    now[0] = 5.0
+    assert cache.get("a") == 1
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_stores_nothing_without_a_size():
+    cache = Cache(size=0)
+    assert cache.put("a", 1) == 1
+    assert cache.get("a") is None
+
+
+def test_counts_hits_and_misses():
+    cache = Cache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0, "hit_rate": 0.5}
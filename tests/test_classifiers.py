@@ -0,0 +1,95 @@
+import pytest
+
+from textblob.classifiers import NaiveBayesClassifier as NaiveBayes
+
+from classifiers import NaiveBayesClassifier, VectorizedClassifier
+
+TEXTS = [
+    "turn on the lights",
+    "switch off the tv",
+    "please turn the printer off",
+    "lights on",
+    "shut down everything",
+    "activate the heating"
+]
+
+
+def extract_features(document, tokens):
+    return {f"contains({word})": word in tokens for word in document.split()}
+
+
+def train(train_set):
+    classifier = NaiveBayes(train_set, feature_extractor=extract_features)
+    classifier.train()
+    return classifier
+
+
+@pytest.fixture
+def train_set(tagger, configurations):
+    return [
+        (text, label)
+        for label, texts in configurations["COMMANDS"]["PHRASES"].items()
+        for text in texts
+    ]
+
+
+def test_vectorized_classification_matches_nltk(train_set):
+    classifier = train(train_set)
+    vectorized = VectorizedClassifier(classifier)
+    texts = TEXTS + [text for text, _ in train_set]
+
+    assert vectorized.classify_many(texts) == [classifier.classify(text) for text in texts]
+    assert [vectorized.classify(text) for text in texts] == [classifier.classify(text) for text in texts]
+
+
+def test_vectorized_export_matches_nltk(train_set):
+    classifier = train(train_set)
+    exported = VectorizedClassifier(classifier).export()
+    for text in TEXTS:
+        features = classifier.extract_features(text)
+        expected = classifier.classifier.prob_classify(features)
+        actual = exported.prob_classify(features)
+        assert [actual.prob(label) for label in classifier.labels()] == pytest.approx(
+            [expected.prob(label) for label in classifier.labels()]
+        )
+
+
+def probabilities(model, classifier, text):
+    distribution = model.prob_classify(classifier.extract_features(text))
+    return [distribution.prob(label) for label in sorted(model.labels())]
+
+
+def test_vectorized_updates_match_retraining(train_set):
+    vectorized = VectorizedClassifier(train(train_set))
+    width = vectorized.counts.shape[1]
+    updates = [
+        ("activate the heating", 1),
+        ("kill the heating", 0),
+        ("switch off the tv", 0),
+        ("brighten the lights", 1)
+    ] + [(f"engage device{i}", i % 2) for i in range(width + 1)]
+
+    for text, label in updates:
+        vectorized.update(text, label)
+    retrained = train(train_set + updates)
+
+    assert vectorized.revision == len(updates)
+    assert vectorized.counts.shape[1] > width
+    assert vectorized.classify_many(TEXTS) == [retrained.classify(text) for text in TEXTS]
+    exported = vectorized.export()
+    for text in TEXTS + [text for text, _ in updates]:
+        assert probabilities(exported, retrained, text) == pytest.approx(
+            probabilities(retrained.classifier, retrained, text)
+        )
+        assert vectorized.classify(text) == retrained.classify(text)
+
+
+def test_vectorized_update_rejects_unknown_labels(train_set):
+    vectorized = VectorizedClassifier(train(train_set))
+    with pytest.raises(ValueError):
+        vectorized.update("activate the heating", "unknown")
+
+
+def test_naive_bayes_rejects_updates(train_set):
+    with pytest.raises(NotImplementedError):
+        NaiveBayesClassifier(train(train_set)).update("activate the heating", 1)
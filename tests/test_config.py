@@ -0,0 +1,48 @@
+import pytest
+
+from config import Configuration
+
+
+def test_loads_the_shipped_configuration(configurations):
+    assert isinstance(configurations["PARAMETERS"], tuple)
+    assert isinstance(configurations["COMMANDS"], Configuration)
+
+
+def test_configurations_are_frozen(configurations):
+    with pytest.raises(TypeError):
+        configurations["DEFAULT_WAKE_WORD"] = "Nova"
+
+
+def test_merge_keeps_sibling_settings(configurations):
+    merged = configurations.merge({"KNX_BAOS_SERVER": {"URL": "http://127.0.0.1/rest/"}})
+    assert merged["KNX_BAOS_SERVER"]["URL"] == "http://127.0.0.1/rest/"
+    assert merged["KNX_BAOS_SERVER"]["USERNAME"] == configurations["KNX_BAOS_SERVER"]["USERNAME"]
+
+
+def test_rejects_missing_settings(configurations):
+    data = configurations.thaw()
+    del data["VERB_TAGS"]
+    with pytest.raises(Configuration.ValidationError):
+        Configuration(data).validate()
+
+
+def test_rejects_missing_section_keys(configurations):
+    data = configurations.thaw()
+    del data["KNX_BAOS_SERVER"]["URL"]
+    with pytest.raises(Configuration.ValidationError):
+        Configuration(data).validate()
+
+
+def test_rejects_routes_without_datapoint_numbers(configurations):
+    with pytest.raises(Configuration.ValidationError):
+        configurations.merge({"ROUTING": {"light": ["one"]}}).validate()
+
+
+def test_rejects_unreadable_files(tmp_path):
+    with pytest.raises(Configuration.ValidationError):
+        Configuration.load(str(tmp_path / "missing.yaml"))
+
+    path = tmp_path / "broken.yaml"
+    path.write_text("COMMANDS: [")
+    with pytest.raises(Configuration.ValidationError):
+        Configuration.load(str(path))
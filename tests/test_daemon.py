@@ -0,0 +1,26 @@
+import asyncio as Asyncio
+
+from daemon import Daemon
+
+
+def serve(room, configurations):
+    Asyncio.run(Asyncio.wait_for(Daemon("rooms", configurations).serve_room("office", room), 5))
+
+
+def test_serves_a_room_until_its_source_ends(build_room, configurations):
+    room = build_room(["turn on the lights", "turn off the lights"])
+    serve(room, configurations)
+    assert room.submitted == [{"turn on the lights": True}, {"turn off the lights": True}]
+    assert room.captures == 3
+
+
+def test_backs_off_after_capture_failures(build_room, configurations, monkeypatch):
+    room = build_room(["turn on the lights"], failures=3)
+    monkeypatch.setattr(Daemon, "BACKOFF", 0.01)
+    serve(room, configurations)
+    assert room.submitted == [{"turn on the lights": True}]
+    assert room.captures == 5
+
+
+def test_backoff_doubles_up_to_its_limit():
+    assert [Daemon.measure_backoff(failures) for failures in range(1, 7)] == [0.5, 1, 2, 4, 8, 8]
@@ -0,0 +1,53 @@
+import threading as Threading
+
+import pytest
+
+from devices import ReplaySource
+from pipeline import Pipeline
+
+
+def run(pipeline):
+    thread = Threading.Thread(target=pipeline.run, daemon=True)
+    thread.start()
+    thread.join(5)
+    return not thread.is_alive()
+
+
+def test_reorder_releases_texts_in_capture_order():
+    items = [(1, "turn on the lights"), (0, "luna"), (3, None), (2, "luna"), (4, "turn off the lights")]
+    assert list(Pipeline(None).reorder(items)) == [
+        "luna",
+        "turn on the lights",
+        "luna",
+        "turn off the lights"
+    ]
+
+
+def test_drains_and_stops_at_the_end_of_the_source(build_room):
+    room = build_room(["turn on the lights", "turn on the tv", "turn off the lights"])
+    assert run(Pipeline(room, workers=2))
+    assert room.submitted == [{"turn on the lights": True}, {"turn on the tv": True}, {"turn off the lights": True}]
+    assert room.captures == 4
+
+
+def test_backs_off_after_capture_failures(build_room):
+    room = build_room(["turn on the lights"], failures=2)
+    pipeline = Pipeline(room)
+    pipeline.BACKOFF = 0.01
+    assert run(pipeline)
+    assert room.submitted == [{"turn on the lights": True}]
+    assert [Pipeline(None).measure_backoff(failures) for failures in range(1, 7)] == [0.5, 1, 2, 4, 8, 8]
+
+
+def test_stops_on_a_sleep_word(build_room):
+    room = build_room(["turn on the lights", "goodbye", "turn on the tv"])
+    assert run(Pipeline(room, workers=1))
+    assert room.submitted == [{"turn on the lights": True}]
+
+
+def test_replay_source_signals_the_end_of_its_recordings():
+    with ReplaySource([], gap=0.1) as source:
+        assert len(source.stream.read(source.CHUNK)) == 2 * source.CHUNK
+        source.stream.read(source.CHUNK)
+        with pytest.raises(EOFError):
+            source.stream.read(source.CHUNK)
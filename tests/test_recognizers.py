@@ -0,0 +1,22 @@
+from recognizers import SphinxRecognizer
+
+
+def test_grammar_leaves_out_clitics_and_punctuation(tmp_path):
+    path = tmp_path / "smartroom.gram"
+    SphinxRecognizer.write_grammar(
+        str(path),
+        {"don't", "can't", "n't", "'s", "'ll", "n'", "Lights", "tv", "TV", "1", ",", "o'clock"}
+    )
+    assert path.read_text().splitlines()[-1] == "public <smartroom> = ( can't | don't | lights | o'clock | tv )+ ;"
+
+
+def test_grammar_is_rewritten_only_when_it_changes(tmp_path):
+    path = tmp_path / "smartroom.gram"
+    fsg = tmp_path / "smartroom.fsg"
+    SphinxRecognizer.write_grammar(str(path), {"lights"})
+    fsg.write_text("compiled")
+
+    SphinxRecognizer.write_grammar(str(path), {"lights"})
+    assert fsg.exists()
+    SphinxRecognizer.write_grammar(str(path), {"lights", "tv"})
+    assert not fsg.exists()
@@ -0,0 +1,180 @@
+import pytest
+
+from devices import Indicator, NullSource
+from smartroom import Smartroom
+
+
+def test_starts_without_hardware(build_smartroom):
+    smartroom = build_smartroom({"DEVICES": {"INDICATOR": "none", "SOURCE": "none"}})
+    assert type(smartroom.indicator) is Indicator
+    assert isinstance(smartroom.microphone, NullSource)
+    assert smartroom.detector is None
+
+
+def test_uses_the_injected_indicator_and_source(build_smartroom):
+    indicator, source = Indicator(), NullSource()
+    smartroom = build_smartroom(indicator=indicator, source=source)
+    assert smartroom.indicator is indicator
+    assert smartroom.microphone is source
+
+
+def test_workers_match_the_parent_without_touching_disk(smartroom, tmp_path):
+    texts = ["turn on the lights", "switch off the tv and turn on the printer", "lights off", ""]
+    files = sorted(path.name for path in tmp_path.iterdir())
+
+    assert smartroom.parse_many(texts, processes=2, chunksize=1) == smartroom.parse_many(texts)
+    assert smartroom.classify_many(texts, processes=2, chunksize=1) == smartroom.classify_many(texts)
+    assert sorted(path.name for path in tmp_path.iterdir()) == files
+
+
+def test_loads_the_tagger_before_serving(build_smartroom, monkeypatch):
+    texts = list()
+    analyze = Smartroom.get_analysis
+    monkeypatch.setattr(Smartroom, "get_analysis", staticmethod(lambda text: texts.append(text) or analyze(text)))
+    build_smartroom()
+    assert texts[0] == "Luna"
+
+
+def test_reload_applies_routing_changes(smartroom):
+    assert dict(smartroom.perform_planning("turn on the printer").telegrams) == {4: True}
+    assert smartroom.reload(smartroom.configurations.merge({"ROUTING": {"printer": [5, 6]}}))
+    assert dict(smartroom.perform_planning("turn on the printer").telegrams) == {5: True, 6: True}
+
+
+def test_reload_publishes_one_snapshot(smartroom):
+    settings = smartroom.settings
+    assert smartroom.reload(smartroom.configurations.merge({"PARAMETERS": [["printer", "printers"]]}))
+
+    assert smartroom.settings is not settings
+    assert smartroom.settings.generation == settings.generation + 1
+    assert smartroom.configurations is smartroom.settings.configurations
+    assert "printers" in smartroom.vocabulary.parameters
+    assert "printers" not in settings.vocabulary.parameters
+
+
+def test_reload_rejects_command_changes(smartroom):
+    settings = smartroom.settings
+    phrases = smartroom.configurations["COMMANDS"].thaw()
+    phrases["PHRASES"][1] = list(phrases["PHRASES"][1]) + ["light it up"]
+    assert not smartroom.reload(smartroom.configurations.merge({"COMMANDS": phrases}))
+    assert smartroom.settings is settings
+
+
+def test_reload_keeps_sections_that_need_a_restart(smartroom, capsys):
+    url = smartroom.configurations["KNX_BAOS_SERVER"]["URL"]
+    assert smartroom.reload(smartroom.configurations.merge({
+        "KNX_BAOS_SERVER": {"URL": "http://192.0.2.1/rest/"},
+        "ROUTING": {"printer": [5]}
+    }))
+
+    assert "needs a restart to apply KNX_BAOS_SERVER\n" in capsys.readouterr().out
+    assert smartroom.configurations["KNX_BAOS_SERVER"]["URL"] == url
+    assert smartroom.vocabulary.routes["printer"] == (5,)
+
+
+def test_reload_rebuilds_the_plan_cache_and_detector(smartroom):
+    detector = smartroom.vad
+    assert smartroom.reload(smartroom.configurations.merge({"CACHE": {"SIZE": 1}, "VAD": {"SILENCE": 1.2}}))
+    assert smartroom.plans.size == 1
+    assert smartroom.vad is not detector
+    assert smartroom.vad.silence == 1.2
+
+
+def test_plans_are_shared_across_casing_and_fillers(smartroom):
+    plan = smartroom.perform_planning("Turn on the TV")
+    assert dict(plan.telegrams) == {3: True}
+    assert smartroom.perform_planning("please turn on the tv") is plan
+
+
+def test_plans_without_a_response_are_not_cached(smartroom):
+    plan = smartroom.perform_planning("hello there")
+    assert not plan.response
+    assert len(smartroom.plans) == 0
+
+
+def interpret_then(smartroom, text, change):
+    interpret = smartroom.perform_interpretation
+
+    def interpret_and_change(text):
+        response = interpret(text)
+        change()
+        return response
+
+    smartroom.perform_interpretation = interpret_and_change
+    try:
+        return smartroom.perform_planning(text)
+    finally:
+        del smartroom.perform_interpretation
+
+
+def test_plans_interpreted_across_a_reload_are_not_served(smartroom):
+    plan = interpret_then(
+        smartroom,
+        "turn on the printer",
+        lambda: smartroom.reload(smartroom.configurations.merge({"ROUTING": {"printer": [5]}}))
+    )
+    assert smartroom.perform_planning("turn on the printer") is not plan
+
+
+def test_rooms_with_different_commands_keep_separate_classifier_files(build_smartroom):
+    office = build_smartroom()
+    commands = office.configurations["COMMANDS"].thaw()
+    commands["PHRASES"][1] = list(commands["PHRASES"][1]) + ["light it up"]
+    kitchen = build_smartroom({"COMMANDS": commands, "CLASSIFIER": {"COMPACT": 1}})
+
+    office.learn("brighten the lights", 1)
+    kitchen.learn("dim the lights", 0)
+    assert office.get_classifier_path("UPDATES") != kitchen.get_classifier_path("UPDATES")
+    assert office.get_classifier_path("SNAPSHOT") != kitchen.get_classifier_path("SNAPSHOT")
+    assert (office.classifier.updates, kitchen.classifier.updates) == (1, 0)
+
+    restarted = build_smartroom()
+    assert restarted.classifier.updates == 1
+    assert list(restarted.classifier.label_counts) == list(office.classifier.label_counts)
+
+
+def test_rooms_sharing_a_classifier_share_its_compaction(build_smartroom):
+    office = build_smartroom({"CLASSIFIER": {"COMPACT": 2}})
+    kitchen = build_smartroom({"CLASSIFIER": {"COMPACT": 2}}, classifier=office.classifier)
+
+    office.learn("brighten the lights", 1)
+    kitchen.learn("dim the lights", 0)
+    assert office.classifier.updates == 0
+    with open(office.get_classifier_path("UPDATES")) as file:
+        assert file.read() == ""
+
+    restarted = build_smartroom({"CLASSIFIER": {"COMPACT": 2}})
+    assert list(restarted.classifier.label_counts) == list(office.classifier.label_counts)
+
+
+def test_naive_bayes_rooms_refuse_to_learn(build_smartroom):
+    smartroom = build_smartroom({"CLASSIFIER": {"ENGINE": "naive_bayes"}})
+    with pytest.raises(Smartroom.ParameterError):
+        smartroom.learn("brighten the lights", 1)
+    assert smartroom.get_classifier_path("UPDATES") and smartroom.classifier.updates == 0
+
+
+def test_exclusions_subtract_datapoints(smartroom):
+    plan = smartroom.perform_planning("turn on everything but not the printer")
+    assert dict(plan.telegrams) == {1: True, 2: True, 3: True}
+
+
+def test_later_clauses_override_earlier_ones(smartroom):
+    plan = smartroom.perform_planning("turn on the lights and turn off the lights")
+    assert dict(plan.telegrams) == {1: False, 2: False}
+
+
+def test_negation_is_scoped_to_its_clause(smartroom):
+    plan = smartroom.perform_planning("turn on the lights and don't turn on the tv")
+    assert dict(plan.telegrams) == {1: True, 2: True, 3: False}
+
+
+def test_naive_resolution_uses_one_label_per_clause(smartroom):
+    labels = smartroom.classifier.classify_many(["switch off the tv", "turn on the printer"])
+    response = smartroom.resolve("switch off the tv and turn on the printer", is_naive=True)
+    assert response == {"tv": ("off", labels[0]), "printer": ("on", labels[1])}
+
+
+def test_batch_classification_matches_single_classification(smartroom):
+    texts = ["turn on the lights", "switch off the tv and turn on the printer", "lights off", ""]
+    assert smartroom.classify_many(texts) == [smartroom.classify(text) for text in texts]
@@ -0,0 +1,41 @@
+import pytest
+
+from vocabulary import Vocabulary
+
+
+@pytest.fixture
+def vocabulary(configurations):
+    return Vocabulary(configurations)
+
+
+def summarize(clauses):
+    return [(clause.verb, clause.polarity, clause.negated, clause.nouns) for clause in clauses]
+
+
+def test_segment_splits_clauses_on_conjunctions(vocabulary, tagger):
+    clauses = vocabulary.segment(tagger("turn on the lights and turn off the tv"))
+    assert summarize(clauses) == [("on", 1, False, ["lights"]), ("off", 0, False, ["tv"])]
+
+
+def test_segment_scopes_negation_and_drops_the_auxiliary(vocabulary, tagger):
+    clauses = vocabulary.segment(tagger("turn on the lights and don't turn on the tv"))
+    assert summarize(clauses) == [("on", 1, False, ["lights"]), ("on", 1, True, ["tv"])]
+
+
+def test_segment_keeps_verbless_exclusions(vocabulary, tagger):
+    clauses = vocabulary.segment(tagger("turn on everything but not the printer"))
+    assert summarize(clauses) == [("on", 1, False, ["everything"]), (None, None, True, ["printer"])]
+
+
+def test_segment_deduplicates_nouns_per_clause(vocabulary, tagger):
+    clauses = vocabulary.segment(tagger("turn on the lights lights and turn off the lights"))
+    assert [clause.nouns for clause in clauses] == [["lights"], ["lights"]]
+
+
+def test_segment_matches_phrases_before_words(vocabulary, tagger):
+    clauses = vocabulary.segment(tagger("turn off all lights"))
+    assert clauses[0].nouns == ["all lights"]
+
+
+def test_extract_nouns_deduplicates_the_utterance(vocabulary, tagger):
+    assert vocabulary.extract_nouns(tagger("turn on the lights and turn off the lights")) == ["lights"]
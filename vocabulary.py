@@ -0,0 +1,154 @@
+class Vocabulary(object):
+    AUXILIARIES = frozenset(("do", "does", "did"))
+    CONJUNCTIONS = frozenset(("and", "but", "then"))
+    NEGATIONS = frozenset(("n't", "not"))
+
+    def __init__(self, configurations):
+        self.noun_tags = frozenset(configurations["NOUN_TAGS"])
+        self.verb_tags = frozenset(configurations["VERB_TAGS"])
+        self.fillers = frozenset(
+            word.lower()
+            for word in configurations.get("CACHE", dict()).get("FILLERS", tuple())
+        )
+        self.parameters = frozenset(
+            parameter
+            for parameters in configurations["PARAMETERS"]
+            for parameter in parameters
+        )
+        self.polarities = {
+            word: label
+            for label, words in configurations["COMMANDS"]["WORDS"].items()
+            for word in words
+        }
+
+        self.words = frozenset(
+            word.lower()
+            for phrase in (
+                [configurations["DEFAULT_WAKE_WORD"]]
+                + list(configurations["DEFAULT_SLEEP_WORDS"])
+                + list(self.parameters)
+                + list(self.polarities)
+                + [
+                    phrase
+                    for phrases in configurations["COMMANDS"]["PHRASES"].values()
+                    for phrase in phrases
+                ]
+            )
+            for word in phrase.split()
+        )
+
+        self.routes = dict()
+        for key, datapoints in configurations.get("ROUTING", dict()).items():
+            group = [
+                parameters
+                for parameters in configurations["PARAMETERS"]
+                if key in parameters
+            ]
+            for parameter in (group[0] if group else [key]):
+                self.routes[parameter] = tuple(datapoints)
+
+        self.phrases = dict()
+        for parameter in self.parameters:
+            words = parameter.split()
+            if len(words) > 1:
+                node = self.phrases
+                for word in words:
+                    node = node.setdefault(word, dict())
+                node[None] = parameter
+
+    def extract_nouns(self, tags):
+        nouns = list()
+        covered = set()
+        for start, end, noun in self.scan_nouns(tags):
+            if end - start > 1 or noun not in covered:
+                nouns += [noun]
+            covered.update(noun.split())
+        return nouns
+
+    def extract_verbs(self, tags):
+        verbs = list()
+        polarities = list()
+
+        for word, tag in tags:
+            if tag in self.verb_tags and word in self.polarities:
+                if verbs and word in self.NEGATIONS:
+                    verbs.pop()
+                    polarities.pop()
+                verbs += [word]
+                polarities += [self.polarities[word]]
+
+        return verbs, polarities
+
+    def scan_nouns(self, tags):
+        i = 0
+
+        while i < len(tags):
+            node, phrase, end = self.phrases, None, i
+            for j in range(i, len(tags)):
+                node = node.get(tags[j][0])
+                if node is None:
+                    break
+                if None in node:
+                    phrase, end = node[None], j + 1
+
+            if phrase is not None:
+                yield i, end, phrase
+                i = end
+                continue
+
+            word, tag = tags[i]
+            if tag in self.noun_tags and word in self.parameters:
+                yield i, i + 1, word
+            i += 1
+
+    def segment(self, tags):
+        nouns = {start: (end, noun) for start, end, noun in self.scan_nouns(tags)}
+        clauses = [Vocabulary.Clause()]
+        i = 0
+
+        while i < len(tags):
+            clause = clauses[-1]
+            if i in nouns:
+                end, noun = nouns[i]
+                if end - i > 1 or noun not in clause.covered:
+                    clause.nouns += [noun]
+                clause.covered.update(noun.split())
+                clause.words += [word for word, tag in tags[i:end]]
+                i = end
+                continue
+
+            word, tag = tags[i]
+            i += 1
+            if tag == "CC" or word.lower() in self.CONJUNCTIONS:
+                if clause.words:
+                    clauses += [Vocabulary.Clause()]
+                continue
+
+            if word in self.NEGATIONS:
+                if clause.nouns and clause.verb is not None:
+                    clause = Vocabulary.Clause()
+                    clauses += [clause]
+                elif clause.verb in self.AUXILIARIES:
+                    clause.verb, clause.polarity = None, None
+                clause.negated = True
+            elif tag in self.verb_tags and word in self.polarities:
+                if clause.nouns and clause.verb is not None:
+                    clause = Vocabulary.Clause()
+                    clauses += [clause]
+                clause.verb, clause.polarity = word, self.polarities[word]
+            clause.words += [word]
+
+        return [clause for clause in clauses if clause.words]
+
+    class Clause(object):
+        def __init__(self):
+            self.words = list()
+            self.nouns = list()
+            self.covered = set()
+            self.verb = None
+            self.polarity = None
+            self.negated = False
+
+        @property
+        def text(self):
+            return " ".join(self.words)